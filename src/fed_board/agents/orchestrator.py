@@ -1,7 +1,6 @@
 """Meeting orchestrator for coordinating FOMC simulations."""
 
 import asyncio
-import json
 from collections import Counter
 from datetime import date, datetime
 from pathlib import Path
@@ -101,7 +100,9 @@ class MeetingOrchestrator:
 
         # Step 1: Fetch economic data
         self._report_progress("Fetching economic data from FRED...", 0.1)
-        indicators = await self.fred_client.get_economic_indicators(as_of_date=meeting_date)
+        # Close the pooled HTTP client before this meeting's event loop ends
+        async with self.fred_client:
+            indicators = await self.fred_client.get_economic_indicators(as_of_date=meeting_date)
 
         # Step 2: Staff presentation (economic briefing)
         self._report_progress("Preparing staff presentation...", 0.15)
@@ -292,14 +293,18 @@ The Committee will continue to monitor incoming data and remains prepared to adj
 
         # Update dissent status based on FINAL decision, not initial proposal
         # A member is a dissenter if their preferred rate differs from the final decision
-        for vote in votes:
+        # Votes are immutable, so replace each one in place with its updated copy
+        for i, vote in enumerate(votes):
             vote_agrees_with_decision = abs(vote.preferred_rate - new_mid) < 0.01
-            vote.is_dissent = not vote_agrees_with_decision
-            # Update vote_for_decision to reflect agreement with final decision
-            vote.vote_for_decision = vote_agrees_with_decision
-            # Clear dissent_reason if they now agree with the decision
-            if not vote.is_dissent:
-                vote.dissent_reason = None
+            votes[i] = vote.model_copy(
+                update={
+                    "is_dissent": not vote_agrees_with_decision,
+                    # Update vote_for_decision to reflect agreement with final decision
+                    "vote_for_decision": vote_agrees_with_decision,
+                    # Clear dissent_reason if they now agree with the decision
+                    "dissent_reason": None if vote_agrees_with_decision else vote.dissent_reason,
+                }
+            )
 
         return Decision(
             rate_decision=rate_decision,
@@ -471,8 +476,8 @@ Key risks to the outlook include persistence of elevated inflation, potential fo
         filename = f"{result.meeting.month_str}.json"
         filepath = output_dir / filename
 
-        with open(filepath, "w") as f:
-            json.dump(result.model_dump(mode="json"), f, indent=2, default=str)
+        # Serialize in pydantic-core rather than dumping to dicts for the stdlib json module
+        filepath.write_bytes(result.model_dump_json(indent=2).encode())
 
         return filepath
 
@@ -490,7 +495,6 @@ Key risks to the outlook include persistence of elevated inflation, potential fo
         if not filepath.exists():
             return None
 
-        with open(filepath, "r") as f:
-            data = json.load(f)
-
-        return MeetingResult(**data)
+        # Parse straight from bytes with pydantic's native JSON parser,
+        # skipping the intermediate dict built by the stdlib json module
+        return MeetingResult.model_validate_json(filepath.read_bytes())
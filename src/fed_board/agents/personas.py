@@ -1,5 +1,8 @@
 """FOMC member persona definitions."""
 
+from dataclasses import dataclass
+from functools import lru_cache
+
 from fed_board.models.member import CommunicationStyle, FOMCMember, Role, Stance
 
 # Board of Governors (always vote)
@@ -471,6 +474,13 @@ FOMC_MEMBERS: list[FOMCMember] = [
 # Quick lookup by short name
 MEMBERS_BY_SHORT_NAME: dict[str, FOMCMember] = {m.short_name: m for m in FOMC_MEMBERS}
 
+# Full and last name indexes for get_member_by_name; on a shared last name, the
+# first member in the roster wins, as with a linear scan
+_MEMBERS_BY_FULL_NAME: dict[str, FOMCMember] = {m.name.lower(): m for m in FOMC_MEMBERS}
+_MEMBERS_BY_LAST_NAME: dict[str, FOMCMember] = {
+    m.name.split()[-1].lower(): m for m in reversed(FOMC_MEMBERS)
+}
+
 
 def get_member_by_name(name: str) -> FOMCMember | None:
     """
@@ -482,23 +492,18 @@ def get_member_by_name(name: str) -> FOMCMember | None:
     Returns:
         FOMCMember or None if not found
     """
-    # Try short name first
     name_lower = name.lower().strip()
-    if name_lower in MEMBERS_BY_SHORT_NAME:
-        return MEMBERS_BY_SHORT_NAME[name_lower]
+    return (
+        MEMBERS_BY_SHORT_NAME.get(name_lower)
+        or _MEMBERS_BY_FULL_NAME.get(name_lower)
+        or _MEMBERS_BY_LAST_NAME.get(name_lower)
+    )
 
-    # Try full name match
-    for member in FOMC_MEMBERS:
-        if member.name.lower() == name_lower:
-            return member
-
-    # Try partial match on last name
-    for member in FOMC_MEMBERS:
-        last_name = member.name.split()[-1].lower()
-        if last_name == name_lower:
-            return member
 
-    return None
+@lru_cache(maxsize=32)
+def _voting_members(year: int) -> tuple[FOMCMember, ...]:
+    """Get the (static) voting roster for a year."""
+    return tuple(m for m in FOMC_MEMBERS if m.is_voting_in_year(year))
 
 
 def get_voting_members(year: int) -> list[FOMCMember]:
@@ -511,7 +516,69 @@ def get_voting_members(year: int) -> list[FOMCMember]:
     Returns:
         List of members with voting rights that year
     """
-    return [m for m in FOMC_MEMBERS if m.is_voting_in_year(year)]
+    return list(_voting_members(year))
+
+
+@dataclass(frozen=True, slots=True)
+class AttendanceGroups:
+    """FOMC participants split into the groups listed in the attendance section."""
+
+    chair: FOMCMember | None
+    vice_chair: FOMCMember | None
+    vice_chair_supervision: FOMCMember | None
+    governors: tuple[FOMCMember, ...]
+    ny_president: FOMCMember | None
+    voting_presidents: tuple[FOMCMember, ...]
+    non_voting_presidents: tuple[FOMCMember, ...]
+
+
+@lru_cache(maxsize=16)
+def get_attendance_groups(year: int) -> AttendanceGroups:
+    """
+    Split the FOMC roster into the groups listed in a meeting's attendance.
+
+    The roster is static, so each year's split is computed once.
+
+    Args:
+        year: The year to check voting eligibility
+
+    Returns:
+        Members grouped by role, with presidents split by voting status
+    """
+    chair = None
+    vice_chair = None
+    vice_chair_supervision = None
+    governors = []
+    ny_president = None
+    voting_presidents = []
+    non_voting_presidents = []
+
+    for member in FOMC_MEMBERS:
+        if member.role == Role.CHAIR:
+            chair = member
+        elif member.role == Role.VICE_CHAIR:
+            vice_chair = member
+        elif member.role == Role.VICE_CHAIR_SUPERVISION:
+            vice_chair_supervision = member
+        elif member.role == Role.GOVERNOR:
+            governors.append(member)
+        elif member.role == Role.PRESIDENT:
+            if "New York" in member.bank:
+                ny_president = member
+            elif member.is_voting_in_year(year):
+                voting_presidents.append(member)
+            else:
+                non_voting_presidents.append(member)
+
+    return AttendanceGroups(
+        chair=chair,
+        vice_chair=vice_chair,
+        vice_chair_supervision=vice_chair_supervision,
+        governors=tuple(governors),
+        ny_president=ny_president,
+        voting_presidents=tuple(voting_presidents),
+        non_voting_presidents=tuple(non_voting_presidents),
+    )
 
 
 def get_members_by_stance(stance: Stance) -> list[FOMCMember]:
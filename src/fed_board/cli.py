@@ -1,10 +1,12 @@
 """Command-line interface for Fed Decision Board."""
 
 import asyncio
-from datetime import datetime
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 from enum import Enum
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import TYPE_CHECKING, Annotated, Optional
 
 import typer
 from rich.console import Console
@@ -14,6 +16,11 @@ from rich.table import Table
 
 from fed_board import __version__
 
+if TYPE_CHECKING:
+    from fed_board.data.fred import FREDClient
+    from fed_board.data.historical_decisions import ActualDecision
+    from fed_board.data.indicators import EconomicIndicators
+
 app = typer.Typer(
     name="fed-board",
     help="AI-powered FOMC meeting simulator using Claude",
@@ -1005,6 +1012,35 @@ def impact(
         ))
 
 
+# How long the current-indicators snapshot used by `changes` stays fresh on disk
+CURRENT_INDICATORS_TTL_SECONDS = 3600
+CURRENT_INDICATORS_SNAPSHOT = "current_indicators"
+
+
+async def _get_current_indicators_cached(
+    fred_client: "FREDClient",
+    ttl_seconds: int = CURRENT_INDICATORS_TTL_SECONDS,
+) -> "EconomicIndicators":
+    """Get current economic indicators, reusing a recent cached snapshot if available."""
+    from fed_board.data.indicators import EconomicIndicators
+
+    # Kept in the FRED cache, so `cache --clear` removes it along with the series
+    snapshot = fred_client.cache.get_snapshot(CURRENT_INDICATORS_SNAPSHOT)
+    if snapshot is not None:
+        try:
+            return EconomicIndicators.model_validate(snapshot)
+        except ValueError:
+            # Snapshot from an older schema - fall through to a fresh fetch
+            pass
+
+    async with fred_client:
+        indicators = await fred_client.get_economic_indicators()
+    fred_client.cache.set_snapshot(
+        CURRENT_INDICATORS_SNAPSHOT, indicators.model_dump(mode="json"), ttl_seconds
+    )
+    return indicators
+
+
 @app.command()
 def changes(
     month: Annotated[
@@ -1053,7 +1089,7 @@ def changes(
     # Fetch current indicators
     console.print("[dim]Fetching current economic data from FRED...[/dim]")
     try:
-        current_indicators = asyncio.run(fred_client.get_economic_indicators())
+        current_indicators = asyncio.run(_get_current_indicators_cached(fred_client))
     except Exception as e:
         console.print(f"[red]Error fetching FRED data: {e}[/red]")
         raise typer.Exit(1)
@@ -1167,12 +1203,18 @@ def changes(
         console.print(f"[yellow]Notable:[/yellow] {', '.join(notable_changes[:3])}")
 
 
-def _stance_bar(score: int, width: int = 10) -> str:
+# Precomputed stance bars indexed by number of filled cells (0 = dove, 10 = hawk)
+STANCE_BAR_WIDTH = 10
+_STANCE_BARS = [
+    "█" * filled + "░" * (STANCE_BAR_WIDTH - filled) for filled in range(STANCE_BAR_WIDTH + 1)
+]
+
+
+def _stance_bar(score: int) -> str:
     """Create a visual bar showing hawk/dove position."""
     # Score -100 to +100 maps to empty (dove) to full (hawk)
-    normalized = (score + 100) / 2  # 0 to 100
-    filled = int((normalized / 100) * width)
-    return "█" * filled + "░" * (width - filled)
+    filled = (score + 100) * STANCE_BAR_WIDTH // 200
+    return _STANCE_BARS[max(0, min(STANCE_BAR_WIDTH, filled))]
 
 
 def _calculate_stance_score(
@@ -1226,21 +1268,31 @@ def stance(
     settings = get_settings()
     orchestrator = MeetingOrchestrator(settings=settings)
 
-    # Collect all simulations
-    simulations = []
+    # Collect all simulations (loads are I/O-bound, so fan them out over threads)
     years_to_check = [year] if year else range(2020, 2030)
+    month_strs = [f"{y}-{month_num:02d}" for y in years_to_check for month_num in range(1, 13)]
 
-    for y in years_to_check:
-        for month_num in range(1, 13):
-            month_str = f"{y}-{month_num:02d}"
-            result = orchestrator.load_result(month_str)
-            if result:
-                simulations.append(result)
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        simulations = [
+            result
+            for result in executor.map(orchestrator.load_result, month_strs)
+            if result
+        ]
 
     if not simulations:
         console.print("[yellow]No simulations found. Run 'simulate' first.[/yellow]")
         raise typer.Exit(1)
 
+    # Resolve the target member up front so other members' votes can be skipped
+    target_name = None
+    if member:
+        target_member = get_member_by_name(member)
+        if target_member is None:
+            console.print(f"[red]Member '{member}' not found.[/red]")
+            console.print("[dim]Use 'fed-board members' to see available members.[/dim]")
+            raise typer.Exit(1)
+        target_name = target_member.name
+
     # Build member stance data
     member_data: dict[str, dict] = {}
 
@@ -1252,6 +1304,8 @@ def stance(
 
         for vote in sim.votes:
             name = vote.member_name
+            if target_name is not None and name != target_name:
+                continue
             if name not in member_data:
                 # Find the member in FOMC_MEMBERS
                 fomc_member = None
@@ -1290,17 +1344,13 @@ def stance(
             if vote.is_dissent:
                 member_data[name]["dissents"] += 1
 
+            # Each member votes once per meeting
+            if target_name is not None:
+                break
+
     # Filter by member if specified
     if member:
-        # Try to find the member
-        target_member = get_member_by_name(member)
-        if target_member is None:
-            console.print(f"[red]Member '{member}' not found.[/red]")
-            console.print("[dim]Use 'fed-board members' to see available members.[/dim]")
-            raise typer.Exit(1)
-
         # Find in our collected data
-        target_name = target_member.name
         if target_name not in member_data:
             console.print(f"[yellow]No voting data found for {target_name}.[/yellow]")
             raise typer.Exit(1)
@@ -1465,6 +1515,17 @@ def stance(
         console.print(table)
 
 
+async def _fetch_actual_decision(
+    fred_client: "FREDClient",
+    meeting_date: date,
+) -> "ActualDecision | None":
+    """Fetch the actual decision for a meeting, closing the HTTP client before returning."""
+    from fed_board.data.historical_decisions import get_actual_decision
+
+    async with fred_client:
+        return await get_actual_decision(fred_client, meeting_date)
+
+
 @app.command()
 def compare(
     month: Annotated[
@@ -1493,9 +1554,6 @@ def compare(
         is_fomc_month,
     )
     from fed_board.data.fred import FREDClient
-    from fed_board.data.historical_decisions import (
-        get_actual_decision,
-    )
 
     settings = get_settings()
     orchestrator = MeetingOrchestrator(settings=settings)
@@ -1518,7 +1576,7 @@ def compare(
             if sim_result is None:
                 continue
 
-            actual = asyncio.run(get_actual_decision(fred_client, meeting_date))
+            actual = asyncio.run(_fetch_actual_decision(fred_client, meeting_date))
             if actual is None:
                 continue
 
@@ -1644,7 +1702,7 @@ def compare(
 
         # Fetch actual decision
         console.print("[dim]Fetching actual Fed decision from FRED...[/dim]")
-        actual = asyncio.run(get_actual_decision(fred_client, meeting_date))
+        actual = asyncio.run(_fetch_actual_decision(fred_client, meeting_date))
 
         if actual is None:
             console.print(f"[yellow]Could not fetch actual Fed decision for {month}.[/yellow]")
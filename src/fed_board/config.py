@@ -1,11 +1,16 @@
 """Configuration management using Pydantic Settings."""
 
+import os
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Literal
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Directories already created by ensure_directories in this process
+_CREATED_DIRS: set[str] = set()
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -48,6 +53,14 @@ class Settings(BaseSettings):
         default=3600,
         description="Cache TTL for daily data in seconds (default: 1h)",
     )
+    fred_cache_ttl_weekly: int = Field(
+        default=86400,
+        description="Cache TTL for weekly data in seconds (default: 24h)",
+    )
+    fred_cache_ttl_quarterly: int = Field(
+        default=604800,
+        description="Cache TTL for quarterly data in seconds (default: 7d)",
+    )
 
     # Logging
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
@@ -61,44 +74,48 @@ class Settings(BaseSettings):
         """Convert string to Path."""
         return Path(v) if isinstance(v, str) else v
 
-    @property
+    @cached_property
     def cache_dir(self) -> Path:
         """Get cache directory path."""
         return self.data_dir / "cache"
 
-    @property
+    @cached_property
     def fred_cache_dir(self) -> Path:
         """Get FRED cache directory path."""
         return self.cache_dir / "fred"
 
-    @property
+    @cached_property
     def simulations_dir(self) -> Path:
         """Get simulations directory path."""
         return self.data_dir / "simulations"
 
-    @property
+    @cached_property
     def minutes_dir(self) -> Path:
         """Get minutes directory path."""
         return self.data_dir / "minutes"
 
-    @property
+    @cached_property
     def dotplots_dir(self) -> Path:
         """Get dot plots directory path."""
         return self.data_dir / "dotplots"
 
     def ensure_directories(self) -> None:
         """Create all required directories if they don't exist."""
-        for directory in [
-            self.data_dir,
-            self.cache_dir,
+        # Only the leaf directories are needed; data_dir and cache_dir are
+        # created along the way as their parents
+        for directory in (
             self.fred_cache_dir,
             self.simulations_dir,
             self.minutes_dir,
             self.dotplots_dir,
-        ]:
-            directory.mkdir(parents=True, exist_ok=True)
+        ):
+            path = str(directory)
+            if path not in _CREATED_DIRS:
+                os.makedirs(path, exist_ok=True)
+                _CREATED_DIRS.add(path)
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get application settings singleton."""
     return Settings()
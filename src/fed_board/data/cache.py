@@ -1,42 +1,91 @@
 """Caching layer for FRED API responses."""
 
-import json
-from datetime import datetime
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic_core import from_json, to_json
 
 
-class CacheEntry(BaseModel):
+@dataclass(slots=True, frozen=True)
+class CacheEntry:
     """A cached data entry."""
 
-    data: Any = Field(..., description="Cached data")
-    cached_at: datetime = Field(
-        default_factory=datetime.now,
-        description="When the data was cached",
-    )
-    ttl_seconds: int = Field(
-        ...,
-        description="Time-to-live in seconds",
-    )
+    data: Any
+    cached_at: float  # Epoch seconds
+    ttl_seconds: int
+
+    @property
+    def expires_at(self) -> float:
+        """Get the expiry time in epoch seconds."""
+        return self.cached_at + self.ttl_seconds
 
     @property
     def is_expired(self) -> bool:
         """Check if the cache entry has expired."""
-        age = (datetime.now() - self.cached_at).total_seconds()
-        return age > self.ttl_seconds
+        return time.time() > self.expires_at
 
     @property
     def age_seconds(self) -> float:
         """Get the age of the cache entry in seconds."""
-        return (datetime.now() - self.cached_at).total_seconds()
+        return time.time() - self.cached_at
+
+
+def _parse_entry(raw: bytes) -> CacheEntry:
+    """Parse raw cache file contents into a CacheEntry."""
+    # The schema is fixed and written by us, so skip model validation
+    entry = from_json(raw)
+    return CacheEntry(
+        data=entry["data"],
+        cached_at=float(entry["cached_at"]),
+        ttl_seconds=int(entry["ttl_seconds"]),
+    )
+
+
+def _write_atomic(path: Path, payload: bytes) -> None:
+    """Write to a temp file and swap it in so readers never see a partial write."""
+    tmp_path = path.with_name(f"{path.name}.tmp.{os.getpid()}")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _read_expiry(path: str) -> float | None:
+    """Read a cache file's expiry epoch seconds, or None if it is unreadable."""
+    try:
+        with open(path, "rb") as f:
+            return _parse_entry(f.read()).expires_at
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
 
 
 class FREDCache:
     """File-based cache for FRED API responses."""
 
-    def __init__(self, cache_dir: Path, ttl_monthly: int = 86400, ttl_daily: int = 3600) -> None:
+    # Maximum number of parsed entries kept in memory on top of the files
+    MEMORY_CACHE_SIZE = 128
+
+    # Sidecar file mapping cache file name -> (mtime_ns, expiry epoch seconds)
+    INDEX_FILENAME = "_index.idx"
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        ttl_monthly: int = 86400,
+        ttl_daily: int = 3600,
+        ttl_weekly: int = 86400,
+        ttl_quarterly: int = 604800,
+    ) -> None:
         """
         Initialize the cache.
 
@@ -44,76 +93,164 @@ class FREDCache:
             cache_dir: Directory to store cache files
             ttl_monthly: TTL for monthly data in seconds (default: 24h)
             ttl_daily: TTL for daily data in seconds (default: 1h)
+            ttl_weekly: TTL for weekly data in seconds (default: 24h)
+            ttl_quarterly: TTL for quarterly data in seconds (default: 7d)
         """
         self.cache_dir = cache_dir
         self.ttl_monthly = ttl_monthly
         self.ttl_daily = ttl_daily
+        self.ttl_weekly = ttl_weekly
+        self.ttl_quarterly = ttl_quarterly
+        # Match each series' TTL to how often it is actually released
+        self._ttls = {
+            "daily": ttl_daily,
+            "weekly": ttl_weekly,
+            "monthly": ttl_monthly,
+            "quarterly": ttl_quarterly,
+        }
+        # series key -> (file mtime_ns, parsed entry), most recently used last
+        self._memory: OrderedDict[str, tuple[int, CacheEntry]] = OrderedDict()
         self._ensure_cache_dir()
+        self._index_path = self.cache_dir / self.INDEX_FILENAME
+        self._index = self._load_index()
+        # The index is only a hint for get_stats, so updates from set() are
+        # kept in memory and written out on the next get_stats() call
+        self._index_dirty = False
 
     def _ensure_cache_dir(self) -> None:
         """Ensure the cache directory exists."""
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
+    def _load_index(self) -> dict[str, tuple[int, float]]:
+        """Load the expiry index, starting empty if it is missing or unreadable."""
+        try:
+            raw = from_json(self._index_path.read_bytes())
+            return {
+                name: (int(mtime_ns), float(expires_at))
+                for name, (mtime_ns, expires_at) in raw.items()
+            }
+        except (OSError, ValueError, TypeError, AttributeError):
+            return {}
+
+    def _save_index(self) -> None:
+        """Persist the expiry index."""
+        _write_atomic(self._index_path, to_json(self._index))
+
     def _get_cache_path(self, series_id: str) -> Path:
         """Get the cache file path for a series."""
         return self.cache_dir / f"{series_id.lower()}.json"
 
-    def get(self, series_id: str) -> dict[str, Any] | None:
+    def get(self, series_id: str) -> list[dict[str, Any]] | None:
         """
-        Get cached data for a series if available and not expired.
+        Get cached observations for a series if available and not expired.
 
         Args:
             series_id: FRED series ID
 
         Returns:
-            Cached data or None if not available/expired
+            Cached observations or None if not available/expired
+        """
+        observations: list[dict[str, Any]] | None = self._get_data(series_id)
+        return observations
+
+    def get_snapshot(self, name: str) -> dict[str, Any] | None:
+        """
+        Get a cached snapshot (e.g. a full indicators set) if available and not expired.
+
+        Args:
+            name: Snapshot name
+
+        Returns:
+            Cached snapshot or None if not available/expired
         """
+        snapshot: dict[str, Any] | None = self._get_data(name)
+        return snapshot
+
+    def _get_data(self, series_id: str) -> Any:
+        """Get the data of an unexpired cache entry, or None."""
+        key = series_id.lower()
         cache_path = self._get_cache_path(series_id)
-        if not cache_path.exists():
-            return None
 
         try:
-            with open(cache_path, "r") as f:
-                raw_data = json.load(f)
+            mtime_ns = cache_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._memory.pop(key, None)
+            return None
 
-            entry = CacheEntry(**raw_data)
-            if entry.is_expired:
-                # Clean up expired cache
+        # Reuse the already-parsed entry if the file hasn't changed since we read it
+        remembered = self._memory.get(key)
+        if remembered is not None and remembered[0] == mtime_ns:
+            self._memory.move_to_end(key)
+            entry = remembered[1]
+        else:
+            try:
+                entry = _parse_entry(cache_path.read_bytes())
+            except FileNotFoundError:
+                return None
+            except (ValueError, KeyError, TypeError):
+                # Corrupted cache file
+                self._index.pop(cache_path.name, None)
                 cache_path.unlink(missing_ok=True)
                 return None
+            self._remember(key, mtime_ns, entry)
 
-            return entry.data
-        except (json.JSONDecodeError, ValueError):
-            # Corrupted cache file
+        if entry.is_expired:
+            # Clean up expired cache
+            self._memory.pop(key, None)
+            self._index.pop(cache_path.name, None)
             cache_path.unlink(missing_ok=True)
             return None
 
+        return entry.data
+
+    def _remember(self, key: str, mtime_ns: int, entry: CacheEntry) -> None:
+        """Store a parsed entry in the in-memory LRU, evicting the oldest if full."""
+        self._memory[key] = (mtime_ns, entry)
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.MEMORY_CACHE_SIZE:
+            self._memory.popitem(last=False)
+
     def set(
         self,
         series_id: str,
-        data: dict[str, Any],
+        data: list[dict[str, Any]],
         frequency: str = "monthly",
     ) -> None:
         """
-        Cache data for a series.
+        Cache observations for a series.
 
         Args:
             series_id: FRED series ID
-            data: Data to cache
+            data: Observations to cache
             frequency: Data frequency ('monthly', 'daily', 'weekly', 'quarterly')
         """
-        ttl = self._get_ttl(frequency)
-        entry = CacheEntry(data=data, ttl_seconds=ttl)
+        self._set_data(series_id, data, self._get_ttl(frequency))
+
+    def set_snapshot(self, name: str, data: dict[str, Any], ttl_seconds: int) -> None:
+        """
+        Cache a snapshot with an explicit TTL.
+
+        Args:
+            name: Snapshot name
+            data: Snapshot to cache
+            ttl_seconds: How long the snapshot stays valid
+        """
+        self._set_data(name, data, ttl_seconds)
+
+    def _set_data(self, series_id: str, data: Any, ttl_seconds: int) -> None:
+        """Write a cache entry and record its expiry in the index."""
+        entry = CacheEntry(data=data, cached_at=time.time(), ttl_seconds=ttl_seconds)
 
         cache_path = self._get_cache_path(series_id)
-        with open(cache_path, "w") as f:
-            json.dump(entry.model_dump(mode="json"), f, default=str)
+        _write_atomic(cache_path, to_json(entry))
+        self._memory.pop(series_id.lower(), None)
+
+        self._index[cache_path.name] = (cache_path.stat().st_mtime_ns, entry.expires_at)
+        self._index_dirty = True
 
     def _get_ttl(self, frequency: str) -> int:
         """Get TTL based on data frequency."""
-        if frequency in ("daily", "weekly"):
-            return self.ttl_daily
-        return self.ttl_monthly
+        return self._ttls.get(frequency, self.ttl_monthly)
 
     def invalidate(self, series_id: str) -> bool:
         """
@@ -125,7 +262,9 @@ class FREDCache:
         Returns:
             True if cache was deleted, False if it didn't exist
         """
+        self._memory.pop(series_id.lower(), None)
         cache_path = self._get_cache_path(series_id)
+        self._index.pop(cache_path.name, None)
         if cache_path.exists():
             cache_path.unlink()
             return True
@@ -138,6 +277,10 @@ class FREDCache:
         Returns:
             Number of cache entries cleared
         """
+        self._memory.clear()
+        self._index.clear()
+        self._index_dirty = False
+        self._index_path.unlink(missing_ok=True)
         count = 0
         for cache_file in self.cache_dir.glob("*.json"):
             cache_file.unlink()
@@ -146,26 +289,47 @@ class FREDCache:
 
     def get_stats(self) -> dict[str, Any]:
         """Get cache statistics."""
-        cache_files = list(self.cache_dir.glob("*.json"))
-        total_size = sum(f.stat().st_size for f in cache_files)
-
-        valid_count = 0
-        expired_count = 0
-
-        for cache_file in cache_files:
-            try:
-                with open(cache_file, "r") as f:
-                    raw_data = json.load(f)
-                entry = CacheEntry(**raw_data)
-                if entry.is_expired:
-                    expired_count += 1
+        # Single directory pass: sizes come from the DirEntry, and expiry from
+        # the index for any file it has seen at the same mtime
+        total_size = 0
+        expiries: list[float | None] = []
+        unindexed: list[tuple[str, str, int]] = []
+        with os.scandir(self.cache_dir) as it:
+            for dir_entry in it:
+                if not dir_entry.name.endswith(".json"):
+                    continue
+                stat = dir_entry.stat()
+                total_size += stat.st_size
+                indexed = self._index.get(dir_entry.name)
+                if indexed is not None and indexed[0] == stat.st_mtime_ns:
+                    expiries.append(indexed[1])
                 else:
-                    valid_count += 1
-            except (json.JSONDecodeError, ValueError):
-                expired_count += 1
+                    unindexed.append((dir_entry.name, dir_entry.path, stat.st_mtime_ns))
+
+        # Files written elsewhere (or before the index existed) have to be read;
+        # that is I/O-bound, so overlap it across threads and remember the result
+        if unindexed:
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                paths = [path for _, path, _ in unindexed]
+                for (name, _, mtime_ns), expires_at in zip(
+                    unindexed, executor.map(_read_expiry, paths), strict=True
+                ):
+                    expiries.append(expires_at)
+                    if expires_at is not None:
+                        self._index[name] = (mtime_ns, expires_at)
+            self._index_dirty = True
+
+        if self._index_dirty:
+            self._save_index()
+            self._index_dirty = False
+
+        now = time.time()
+        valid_count = sum(1 for e in expiries if e is not None and now <= e)
+        expired_count = len(expiries) - valid_count
 
         return {
-            "total_entries": len(cache_files),
+            "total_entries": valid_count + expired_count,
             "valid_entries": valid_count,
             "expired_entries": expired_count,
             "total_size_bytes": total_size,
@@ -1,5 +1,6 @@
 """FOMC meeting schedule data."""
 
+from bisect import bisect_right
 from datetime import date
 
 # Official FOMC meeting dates (announcement day - typically day 2 of 2-day meetings)
@@ -24,6 +25,27 @@ FOMC_MEETINGS: dict[int, list[str]] = {
 }
 
 
+# Parsed lookups built once at import time from FOMC_MEETINGS
+_FOMC_DATES_BY_YEAR: dict[int, tuple[date, ...]] = {
+    year: tuple(date.fromisoformat(m) for m in meetings)
+    for year, meetings in FOMC_MEETINGS.items()
+}
+_FOMC_BY_YEAR_MONTH: dict[tuple[int, int], date] = {
+    (d.year, d.month): d for dates in _FOMC_DATES_BY_YEAR.values() for d in dates
+}
+_FOMC_MONTH_STRS_BY_YEAR: dict[int, tuple[str, ...]] = {
+    year: tuple(d.strftime("%Y-%m") for d in dates)
+    for year, dates in _FOMC_DATES_BY_YEAR.items()
+}
+_FOMC_BY_MONTH_STR: dict[str, date] = {
+    d.strftime("%Y-%m"): d for dates in _FOMC_DATES_BY_YEAR.values() for d in dates
+}
+_FOMC_MONTHS: frozenset[str] = frozenset(_FOMC_BY_MONTH_STR)
+_FOMC_SORTED_ALL: tuple[date, ...] = tuple(
+    sorted(d for dates in _FOMC_DATES_BY_YEAR.values() for d in dates)
+)
+
+
 def get_fomc_meeting_date(month: str) -> date | None:
     """
     Get the actual FOMC meeting date for a given month.
@@ -34,15 +56,13 @@ def get_fomc_meeting_date(month: str) -> date | None:
     Returns:
         The meeting date, or None if no meeting in that month
     """
-    year, month_num = map(int, month.split("-"))
-    meetings = FOMC_MEETINGS.get(year, [])
+    meeting_date = _FOMC_BY_MONTH_STR.get(month)
+    if meeting_date is not None:
+        return meeting_date
 
-    for meeting_str in meetings:
-        meeting_date = date.fromisoformat(meeting_str)
-        if meeting_date.month == month_num:
-            return meeting_date
-
-    return None
+    # Fall back to parsing for non-padded input such as "2025-3"
+    year, month_num = map(int, month.split("-"))
+    return _FOMC_BY_YEAR_MONTH.get((year, month_num))
 
 
 def get_fomc_months(year: int) -> list[str]:
@@ -55,8 +75,7 @@ def get_fomc_months(year: int) -> list[str]:
     Returns:
         List of month strings in YYYY-MM format
     """
-    meetings = FOMC_MEETINGS.get(year, [])
-    return [date.fromisoformat(m).strftime("%Y-%m") for m in meetings]
+    return list(_FOMC_MONTH_STRS_BY_YEAR.get(year, ()))
 
 
 def get_all_fomc_dates(year: int) -> list[date]:
@@ -69,8 +88,7 @@ def get_all_fomc_dates(year: int) -> list[date]:
     Returns:
         List of meeting dates
     """
-    meetings = FOMC_MEETINGS.get(year, [])
-    return [date.fromisoformat(m) for m in meetings]
+    return list(_FOMC_DATES_BY_YEAR.get(year, ()))
 
 
 def is_fomc_month(month: str) -> bool:
@@ -83,7 +101,7 @@ def is_fomc_month(month: str) -> bool:
     Returns:
         True if there's a meeting in that month
     """
-    return get_fomc_meeting_date(month) is not None
+    return month in _FOMC_MONTHS or get_fomc_meeting_date(month) is not None
 
 
 def get_next_fomc_meeting(from_date: date | None = None) -> tuple[str, date] | None:
@@ -99,10 +117,12 @@ def get_next_fomc_meeting(from_date: date | None = None) -> tuple[str, date] | N
     if from_date is None:
         from_date = date.today()
 
-    for year in range(from_date.year, from_date.year + 2):
-        for meeting_str in FOMC_MEETINGS.get(year, []):
-            meeting_date = date.fromisoformat(meeting_str)
-            if meeting_date > from_date:
-                return meeting_date.strftime("%Y-%m"), meeting_date
+    index = bisect_right(_FOMC_SORTED_ALL, from_date)
+    if index == len(_FOMC_SORTED_ALL):
+        return None
 
-    return None
+    # Only look ahead through the following year
+    meeting_date = _FOMC_SORTED_ALL[index]
+    if meeting_date.year > from_date.year + 1:
+        return None
+    return meeting_date.strftime("%Y-%m"), meeting_date
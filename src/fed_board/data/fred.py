@@ -1,10 +1,18 @@
 """FRED API client for fetching economic data."""
 
 import asyncio
+import contextlib
+import importlib.util
+import random
+import ssl
+from collections.abc import Callable
 from datetime import date, timedelta
+from functools import lru_cache, partial
+from types import TracebackType
 from typing import Any
 
 import httpx
+from pydantic_core import from_json
 
 from fed_board.config import Settings, get_settings
 from fed_board.data.cache import FREDCache
@@ -20,6 +28,36 @@ from fed_board.data.indicators import (
     MarketIndicators,
 )
 
+# HTTP/2 lets all concurrent series requests share one multiplexed connection,
+# but httpx only supports it when the optional h2 package is installed
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Upper bound on a server-requested Retry-After wait
+_MAX_RETRY_DELAY_SECONDS = 10.0
+
+# Release frequency by series ID, so caching a response is a single dict probe
+_SERIES_FREQUENCIES: dict[str, str] = {
+    sid: FRED_FREQUENCIES.get(key, "monthly") for key, sid in FRED_SERIES.items()
+}
+
+
+@lru_cache(maxsize=1)
+def _ssl_context() -> ssl.SSLContext:
+    """Get the TLS context shared by all FRED clients, so CA certificates load once."""
+    return httpx.create_ssl_context()
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Get how long to wait before retrying, honoring Retry-After when given in seconds."""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return min(max(float(retry_after), 0.0), _MAX_RETRY_DELAY_SECONDS)
+        except ValueError:
+            pass
+    # Exponential backoff with jitter so concurrent retries don't arrive together
+    return 0.25 * 2.0**attempt + random.random() * 0.1
+
 
 class FREDAPIError(Exception):
     """Exception raised for FRED API errors."""
@@ -30,11 +68,297 @@ class FREDAPIError(Exception):
         super().__init__(self.message)
 
 
+def _latest_value(observations: list[dict[str, Any]]) -> float | None:
+    """Get the most recent value from observations sorted newest first."""
+    if not observations:
+        return None
+
+    value = observations[0].get("value")
+    if value is None or value == ".":
+        return None
+
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _yoy_change(observations: list[dict[str, Any]]) -> float | None:
+    """Calculate the year-over-year % change from monthly observations, newest first."""
+    if len(observations) < 12:
+        return None
+
+    try:
+        current_value = float(observations[0]["value"])
+        # Find observation from ~12 months ago
+        year_ago_value = float(observations[12]["value"])
+
+        if year_ago_value == 0:
+            return None
+
+        return ((current_value - year_ago_value) / year_ago_value) * 100
+    except (ValueError, IndexError, KeyError):
+        return None
+
+
+def _mom_change(observations: list[dict[str, Any]]) -> float | None:
+    """Calculate the period-over-period % change from observations, newest first."""
+    if len(observations) < 2:
+        return None
+
+    try:
+        current_value = float(observations[0]["value"])
+        previous_value = float(observations[1]["value"])
+
+        if previous_value == 0:
+            return None
+
+        return ((current_value - previous_value) / previous_value) * 100
+    except (ValueError, IndexError, KeyError):
+        return None
+
+
+def parse_observations(
+    observations: list[dict[str, Any]],
+) -> tuple[list[float | None], list[date]]:
+    """
+    Parse FRED observations into parallel value and date lists in one pass.
+
+    Args:
+        observations: Observations as returned by the API
+
+    Returns:
+        Tuple of (values, dates), with None for missing ('.') values
+
+    Raises:
+        ValueError: If a value or date is malformed
+        KeyError: If an observation lacks a value or date
+    """
+    values = [None if (value := obs["value"]) == "." else float(value) for obs in observations]
+    dates = [date.fromisoformat(obs["date"]) for obs in observations]
+    return values, dates
+
+
+def _parse_each_observation(
+    observations: list[dict[str, Any]],
+) -> list[tuple[float, date] | None]:
+    """Parse observations one at a time, with None for missing ('.') or malformed ones."""
+    parsed: list[tuple[float, date] | None] = []
+    for obs in observations:
+        try:
+            values, dates = parse_observations([obs])
+        except (ValueError, KeyError):
+            # Skip just the bad observation so the rest of the trend survives
+            parsed.append(None)
+            continue
+        value = values[0]
+        parsed.append(None if value is None else (value, dates[0]))
+    return parsed
+
+
+def _indicator_with_trend(
+    observations: list[dict[str, Any]],
+    num_periods: int,
+) -> IndicatorValue:
+    """Build an IndicatorValue from the latest num_periods observations, newest first."""
+    present = [p for p in _parse_each_observation(observations[:num_periods]) if p is not None]
+    return IndicatorValue.from_values(
+        [value for value, _ in present],
+        [obs_date for _, obs_date in present] or None,
+    )
+
+
+def _yoy_with_trend(observations: list[dict[str, Any]]) -> IndicatorValue:
+    """Build an IndicatorValue of the last 3 YoY % changes from observations, newest first."""
+    if len(observations) < 13:
+        return IndicatorValue()
+
+    parsed = _parse_each_observation(observations[:15])
+    yoy_values = []
+    yoy_dates = []
+
+    # Calculate YoY for the last 3 periods
+    for i in range(len(parsed) - 12):
+        current = parsed[i]
+        year_ago = parsed[i + 12]
+        if current is not None and year_ago is not None and year_ago[0]:
+            yoy_values.append(((current[0] - year_ago[0]) / year_ago[0]) * 100)
+            yoy_dates.append(current[1])
+
+    return IndicatorValue.from_values(yoy_values, yoy_dates or None)
+
+
+# Snapshot field -> (FRED_SERIES key, derivation from the series' recent observations)
+_SNAPSHOT_METRICS: dict[str, tuple[str, Callable[[list[dict[str, Any]]], float | None]]] = {
+    # Inflation (YoY)
+    "cpi_yoy": ("cpi_yoy", _yoy_change),
+    "core_cpi_yoy": ("core_cpi_yoy", _yoy_change),
+    "pce_yoy": ("pce_yoy", _yoy_change),
+    "core_pce_yoy": ("core_pce_yoy", _yoy_change),
+    # Employment
+    "unemployment_rate": ("unemployment_rate", _latest_value),
+    "nonfarm_payrolls": ("nonfarm_payrolls", _latest_value),
+    "nonfarm_payrolls_mom": ("nonfarm_payrolls", _mom_change),
+    "labor_force_participation": ("labor_force_participation", _latest_value),
+    "wage_growth_yoy": ("wage_growth_yoy", _yoy_change),
+    "job_openings": ("job_openings", _latest_value),
+    "initial_claims": ("initial_claims", _latest_value),
+    # Activity
+    "gdp_growth": ("gdp_growth", _latest_value),
+    "retail_sales_mom": ("retail_sales_mom", _mom_change),
+    "industrial_production": ("industrial_production", _latest_value),
+    "industrial_production_yoy": ("industrial_production", _yoy_change),
+    "capacity_utilization": ("capacity_utilization", _latest_value),
+    "housing_starts": ("housing_starts", _latest_value),
+    # Markets
+    "fed_funds_rate": ("fed_funds_rate", _latest_value),
+    "fed_funds_target_upper": ("fed_funds_target_upper", _latest_value),
+    "fed_funds_target_lower": ("fed_funds_target_lower", _latest_value),
+    "treasury_10y": ("treasury_10y", _latest_value),
+    "treasury_2y": ("treasury_2y", _latest_value),
+    "treasury_3m": ("treasury_3m", _latest_value),
+    "sp500": ("sp500", _latest_value),
+    # Expectations
+    "michigan_sentiment": ("michigan_sentiment", _latest_value),
+    "breakeven_5y": ("breakeven_5y", _latest_value),
+    "breakeven_10y": ("breakeven_10y", _latest_value),
+}
+
+_trend_3 = partial(_indicator_with_trend, num_periods=3)
+_trend_5 = partial(_indicator_with_trend, num_periods=5)
+
+# Trend field -> (FRED_SERIES key, derivation) for key indicators
+_SNAPSHOT_TRENDS: dict[str, tuple[str, Callable[[list[dict[str, Any]]], IndicatorValue]]] = {
+    # Inflation trends (YoY values)
+    "cpi_yoy": ("cpi_yoy", _yoy_with_trend),
+    "core_cpi_yoy": ("core_cpi_yoy", _yoy_with_trend),
+    "pce_yoy": ("pce_yoy", _yoy_with_trend),
+    "core_pce_yoy": ("core_pce_yoy", _yoy_with_trend),
+    # Employment trends
+    "unemployment_rate": ("unemployment_rate", _trend_3),
+    "labor_force_participation": ("labor_force_participation", _trend_3),
+    "wage_growth_yoy": ("wage_growth_yoy", _yoy_with_trend),
+    "job_openings": ("job_openings", _trend_3),
+    # Activity trends
+    "gdp_growth": ("gdp_growth", _trend_3),
+    "retail_sales_mom": ("retail_sales_mom", _trend_3),
+    "industrial_production_yoy": ("industrial_production", _yoy_with_trend),
+    "capacity_utilization": ("capacity_utilization", _trend_3),
+    # Market trends
+    "treasury_10y": ("treasury_10y", _trend_5),
+    "treasury_2y": ("treasury_2y", _trend_5),
+    # Expectations trends
+    "michigan_sentiment": ("michigan_sentiment", _trend_3),
+    "breakeven_5y": ("breakeven_5y", _trend_5),
+    "breakeven_10y": ("breakeven_10y", _trend_5),
+}
+
+# Unique series behind the snapshot, in first-use order
+_SNAPSHOT_SERIES_IDS: tuple[str, ...] = tuple(
+    dict.fromkeys(
+        FRED_SERIES[key]
+        for key, _ in (*_SNAPSHOT_METRICS.values(), *_SNAPSHOT_TRENDS.values())
+    )
+)
+
+
+def _resolve_snapshot_table(
+    table: dict[str, tuple[str, Callable[[list[dict[str, Any]]], Any]]],
+) -> tuple[tuple[str, int, Callable[[list[dict[str, Any]]], Any]], ...]:
+    """Resolve a snapshot table to (field, position in _SNAPSHOT_SERIES_IDS, derivation)."""
+    positions = {series_id: i for i, series_id in enumerate(_SNAPSHOT_SERIES_IDS)}
+    return tuple(
+        (name, positions[FRED_SERIES[key]], compute) for name, (key, compute) in table.items()
+    )
+
+
+# Resolved once at import so building a snapshot does no FRED_SERIES lookups
+_SNAPSHOT_METRIC_SPEC = _resolve_snapshot_table(_SNAPSHOT_METRICS)
+_SNAPSHOT_TREND_SPEC = _resolve_snapshot_table(_SNAPSHOT_TRENDS)
+
+
+def _build_indicators(
+    as_of_date: date,
+    results: list[list[dict[str, Any]]],
+) -> EconomicIndicators:
+    """
+    Build an EconomicIndicators snapshot from fetched series.
+
+    Args:
+        as_of_date: Date for the snapshot
+        results: Observations for each of _SNAPSHOT_SERIES_IDS, in order
+
+    Returns:
+        Complete EconomicIndicators snapshot
+    """
+    data = {name: compute(results[position]) for name, position, compute in _SNAPSHOT_METRIC_SPEC}
+    trends = {
+        name: compute(results[position]) for name, position, compute in _SNAPSHOT_TREND_SPEC
+    }
+
+    # Calculate nonfarm payrolls change (in thousands)
+    nonfarm_change = None
+    if data.get("nonfarm_payrolls_mom") is not None and data.get("nonfarm_payrolls") is not None:
+        # Convert percentage change to absolute change in thousands
+        nonfarm_change = (data["nonfarm_payrolls_mom"] / 100) * data["nonfarm_payrolls"]
+
+    # Build the indicators object
+    return EconomicIndicators(
+        as_of_date=as_of_date,
+        inflation=InflationIndicators(
+            cpi_yoy=data.get("cpi_yoy"),
+            core_cpi_yoy=data.get("core_cpi_yoy"),
+            pce_yoy=data.get("pce_yoy"),
+            core_pce_yoy=data.get("core_pce_yoy"),
+        ),
+        employment=EmploymentIndicators(
+            unemployment_rate=data.get("unemployment_rate"),
+            nonfarm_payrolls=data.get("nonfarm_payrolls"),
+            nonfarm_payrolls_change=nonfarm_change,
+            labor_force_participation=data.get("labor_force_participation"),
+            wage_growth_yoy=data.get("wage_growth_yoy"),
+            job_openings=data.get("job_openings"),
+            initial_claims=data.get("initial_claims"),
+        ),
+        activity=ActivityIndicators(
+            gdp_growth=data.get("gdp_growth"),
+            retail_sales_mom=data.get("retail_sales_mom"),
+            industrial_production=data.get("industrial_production"),
+            industrial_production_yoy=data.get("industrial_production_yoy"),
+            capacity_utilization=data.get("capacity_utilization"),
+            housing_starts=data.get("housing_starts"),
+        ),
+        markets=MarketIndicators(
+            fed_funds_rate=data.get("fed_funds_rate"),
+            fed_funds_target_upper=data.get("fed_funds_target_upper"),
+            fed_funds_target_lower=data.get("fed_funds_target_lower"),
+            treasury_10y=data.get("treasury_10y"),
+            treasury_2y=data.get("treasury_2y"),
+            treasury_3m=data.get("treasury_3m"),
+            sp500=data.get("sp500"),
+        ),
+        expectations=ExpectationsIndicators(
+            michigan_sentiment=data.get("michigan_sentiment"),
+            breakeven_5y=data.get("breakeven_5y"),
+            breakeven_10y=data.get("breakeven_10y"),
+        ),
+        trends=trends,
+    )
+
+
 class FREDClient:
     """Async client for the FRED API."""
 
     BASE_URL = "https://api.stlouisfed.org/fred"
 
+    # Transient responses worth retrying, and the total attempts per request
+    RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+    MAX_ATTEMPTS = 3
+
+    # One fetch per series covers 3 YoY periods (15 monthly obs) with headroom
+    RECENT_LIMIT = 20
+    RECENT_LOOKBACK_DAYS = 500
+
     def __init__(self, settings: Settings | None = None) -> None:
         """
         Initialize the FRED client.
@@ -48,7 +372,58 @@ class FREDClient:
             cache_dir=self.settings.fred_cache_dir,
             ttl_monthly=self.settings.fred_cache_ttl_monthly,
             ttl_daily=self.settings.fred_cache_ttl_daily,
+            ttl_weekly=self.settings.fred_cache_ttl_weekly,
+            ttl_quarterly=self.settings.fred_cache_ttl_quarterly,
         )
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        # (series_id, start, end, limit, sort_order) -> fetch currently in progress
+        self._inflight: dict[
+            tuple[str, date, date, int, str], asyncio.Task[list[dict[str, Any]]]
+        ] = {}
+
+    async def __aenter__(self) -> "FREDClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client, creating it on first use.
+
+        The client's connection pool is bound to the event loop it was created
+        on, so a new one is built if we're called from a different loop (e.g.
+        successive asyncio.run() calls from the CLI).
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._client_loop is not loop:
+            # The client's loop has finished, so it can no longer be awaited
+            # closed; drop it rather than reuse its dead connections. Callers
+            # should close via aclose() or `async with` before their loop ends
+            self._client = None
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.BASE_URL,
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+                verify=_ssl_context(),
+                http2=_HTTP2_AVAILABLE,
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
 
     async def _request(
         self,
@@ -68,29 +443,39 @@ class FREDClient:
         Raises:
             FREDAPIError: If the API returns an error
         """
-        url = f"{self.BASE_URL}/{endpoint}"
         request_params = {
             "api_key": self.api_key,
             "file_type": "json",
             **(params or {}),
         }
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, params=request_params)
-
-            if response.status_code != 200:
-                raise FREDAPIError(
-                    f"FRED API error: {response.text}",
-                    status_code=response.status_code,
-                )
-
-            data = response.json()
-
-            # Check for FRED error messages
-            if "error_message" in data:
-                raise FREDAPIError(data["error_message"])
-
-            return data
+        # Reuse pooled keep-alive connections instead of a new TCP+TLS handshake per call
+        client = self._get_client()
+        for attempt in range(self.MAX_ATTEMPTS):
+            response = await client.get(endpoint, params=request_params)
+            if (
+                response.status_code not in self.RETRY_STATUS_CODES
+                or attempt == self.MAX_ATTEMPTS - 1
+            ):
+                break
+            # Retry transient failures here rather than losing the indicator
+            # from the whole snapshot
+            await asyncio.sleep(_retry_delay(response, attempt))
+
+        if response.status_code != 200:
+            raise FREDAPIError(
+                f"FRED API error: {response.text}",
+                status_code=response.status_code,
+            )
+
+        # pydantic_core's Rust JSON parser is several times faster than stdlib json
+        data = from_json(response.content)
+
+        # Check for FRED error messages
+        if "error_message" in data:
+            raise FREDAPIError(data["error_message"])
+
+        return data
 
     async def get_series(
         self,
@@ -115,11 +500,13 @@ class FREDClient:
         Returns:
             List of observations
         """
-        # Check cache first
-        if use_cache:
-            cached = self.cache.get(series_id)
-            if cached is not None:
-                return cached
+        # Cache per query, not per series, so differently-shaped requests
+        # for the same series never serve each other's observations. A window
+        # that ends today is keyed as "latest" rather than by date, so the key
+        # stays stable from one day to the next and entries expire by TTL
+        key_start = start_date.isoformat() if start_date else "365d"
+        key_end = end_date.isoformat() if end_date else "latest"
+        cache_key = f"{series_id}_{key_start}_{key_end}_{limit}_{sort_order}"
 
         # Set default dates if not provided
         if end_date is None:
@@ -127,26 +514,111 @@ class FREDClient:
         if start_date is None:
             start_date = end_date - timedelta(days=365)
 
-        params = {
-            "series_id": series_id,
-            "observation_start": start_date.isoformat(),
-            "observation_end": end_date.isoformat(),
-            "limit": limit,
-            "sort_order": sort_order,
-        }
+        return await self._get_observations(
+            series_id, start_date, end_date, limit, sort_order, cache_key, use_cache
+        )
+
+    async def _get_observations(
+        self,
+        series_id: str,
+        start_date: date,
+        end_date: date,
+        limit: int,
+        sort_order: str,
+        cache_key: str,
+        use_cache: bool,
+    ) -> list[dict[str, Any]]:
+        """
+        Get observations for a query, from the cache or a shared in-flight request.
+
+        Args:
+            series_id: FRED series ID
+            start_date: Start date for observations
+            end_date: End date for observations
+            limit: Maximum number of observations
+            sort_order: 'asc' or 'desc'
+            cache_key: Key the query's observations are cached under
+            use_cache: Whether to use cached data
 
+        Returns:
+            List of observations
+        """
+        # Check cache first
+        if use_cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        # Concurrent callers for the same query share one request
+        key = (series_id, start_date, end_date, limit, sort_order)
+        fetch = self._inflight.get(key)
+        if fetch is None:
+            params = {
+                "series_id": series_id,
+                "observation_start": start_date.isoformat(),
+                "observation_end": end_date.isoformat(),
+                "limit": limit,
+                "sort_order": sort_order,
+            }
+            fetch = asyncio.ensure_future(self._fetch_series(params, cache_key))
+            self._inflight[key] = fetch
+            fetch.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield so one cancelled caller doesn't cancel the fetch for the others
+        return await asyncio.shield(fetch)
+
+    async def _fetch_series(self, params: dict[str, Any], cache_key: str) -> list[dict[str, Any]]:
+        """
+        Request observations from the API and cache them.
+
+        Args:
+            params: Query parameters for the observations endpoint
+            cache_key: Key to cache the observations under
+
+        Returns:
+            List of observations
+        """
         data = await self._request("series/observations", params)
-        observations = data.get("observations", [])
+        # Only date and value are ever read; dropping the realtime_* fields
+        # roughly halves what the cache has to write and parse
+        observations = [
+            {"date": obs["date"], "value": obs["value"]} for obs in data.get("observations", [])
+        ]
 
         # Cache the result
-        frequency = FRED_FREQUENCIES.get(
-            self._get_indicator_key(series_id),
-            "monthly",
-        )
-        self.cache.set(series_id, observations, frequency)
+        frequency = _SERIES_FREQUENCIES.get(params["series_id"], "monthly")
+        self.cache.set(cache_key, observations, frequency)
 
         return observations
 
+    async def _fetch_recent(self, series_id: str, use_cache: bool = True) -> list[dict[str, Any]]:
+        """
+        Fetch enough recent observations to derive every metric for a series.
+
+        The latest value, MoM, YoY and trend helpers all slice this one list,
+        so each series costs a single request and cache entry.
+
+        Args:
+            series_id: FRED series ID
+            use_cache: Whether to use cached data
+
+        Returns:
+            Observations sorted newest first
+        """
+        end_date = date.today()
+        # Keyed by the lookback rather than today's date so the entry is reused
+        # for as long as its TTL allows
+        cache_key = f"{series_id}_{self.RECENT_LOOKBACK_DAYS}d_latest_{self.RECENT_LIMIT}_desc"
+        return await self._get_observations(
+            series_id,
+            end_date - timedelta(days=self.RECENT_LOOKBACK_DAYS),
+            end_date,
+            self.RECENT_LIMIT,
+            "desc",
+            cache_key,
+            use_cache,
+        )
+
     async def get_latest_value(
         self,
         series_id: str,
@@ -162,19 +634,7 @@ class FREDClient:
         Returns:
             Latest value or None if not available
         """
-        observations = await self.get_series(series_id, limit=1, use_cache=use_cache)
-
-        if not observations:
-            return None
-
-        value = observations[0].get("value")
-        if value is None or value == ".":
-            return None
-
-        try:
-            return float(value)
-        except ValueError:
-            return None
+        return _latest_value(await self._fetch_recent(series_id, use_cache))
 
     async def get_yoy_change(
         self,
@@ -191,28 +651,7 @@ class FREDClient:
         Returns:
             YoY percentage change or None
         """
-        observations = await self.get_series(
-            series_id,
-            start_date=date.today() - timedelta(days=400),
-            limit=15,
-            sort_order="desc",
-            use_cache=use_cache,
-        )
-
-        if len(observations) < 12:
-            return None
-
-        try:
-            current_value = float(observations[0]["value"])
-            # Find observation from ~12 months ago
-            year_ago_value = float(observations[12]["value"])
-
-            if year_ago_value == 0:
-                return None
-
-            return ((current_value - year_ago_value) / year_ago_value) * 100
-        except (ValueError, IndexError, KeyError):
-            return None
+        return _yoy_change(await self._fetch_recent(series_id, use_cache))
 
     async def get_mom_change(
         self,
@@ -229,27 +668,7 @@ class FREDClient:
         Returns:
             MoM percentage change or None
         """
-        observations = await self.get_series(
-            series_id,
-            start_date=date.today() - timedelta(days=90),
-            limit=3,
-            sort_order="desc",
-            use_cache=use_cache,
-        )
-
-        if len(observations) < 2:
-            return None
-
-        try:
-            current_value = float(observations[0]["value"])
-            previous_value = float(observations[1]["value"])
-
-            if previous_value == 0:
-                return None
-
-            return ((current_value - previous_value) / previous_value) * 100
-        except (ValueError, IndexError, KeyError):
-            return None
+        return _mom_change(await self._fetch_recent(series_id, use_cache))
 
     async def get_indicator_with_trend(
         self,
@@ -268,27 +687,7 @@ class FREDClient:
         Returns:
             IndicatorValue with current, previous values and trend
         """
-        observations = await self.get_series(
-            series_id,
-            start_date=date.today() - timedelta(days=365),
-            limit=num_periods + 2,  # Get a few extra in case of missing data
-            sort_order="desc",
-            use_cache=use_cache,
-        )
-
-        values = []
-        dates = []
-        for obs in observations[:num_periods]:
-            val = obs.get("value")
-            if val is not None and val != ".":
-                try:
-                    values.append(float(val))
-                    if obs.get("date"):
-                        dates.append(date.fromisoformat(obs["date"]))
-                except ValueError:
-                    continue
-
-        return IndicatorValue.from_values(values, dates if dates else None)
+        return _indicator_with_trend(await self._fetch_recent(series_id, use_cache), num_periods)
 
     async def get_yoy_with_trend(
         self,
@@ -305,34 +704,7 @@ class FREDClient:
         Returns:
             IndicatorValue with YoY values and trend
         """
-        observations = await self.get_series(
-            series_id,
-            start_date=date.today() - timedelta(days=500),
-            limit=18,  # Need 15+ for 3 YoY calculations
-            sort_order="desc",
-            use_cache=use_cache,
-        )
-
-        if len(observations) < 13:
-            return IndicatorValue()
-
-        yoy_values = []
-        dates = []
-
-        # Calculate YoY for the last 3 periods
-        for i in range(min(3, len(observations) - 12)):
-            try:
-                current = float(observations[i]["value"])
-                year_ago = float(observations[i + 12]["value"])
-                if year_ago != 0:
-                    yoy = ((current - year_ago) / year_ago) * 100
-                    yoy_values.append(yoy)
-                    if observations[i].get("date"):
-                        dates.append(date.fromisoformat(observations[i]["date"]))
-            except (ValueError, IndexError, KeyError):
-                continue
-
-        return IndicatorValue.from_values(yoy_values, dates if dates else None)
+        return _yoy_with_trend(await self._fetch_recent(series_id, use_cache))
 
     async def get_economic_indicators(
         self,
@@ -352,158 +724,22 @@ class FREDClient:
         if as_of_date is None:
             as_of_date = date.today()
 
-        # Fetch all data concurrently
-        tasks = {
-            # Inflation (YoY)
-            "cpi_yoy": self.get_yoy_change(FRED_SERIES["cpi_yoy"], use_cache),
-            "core_cpi_yoy": self.get_yoy_change(FRED_SERIES["core_cpi_yoy"], use_cache),
-            "pce_yoy": self.get_yoy_change(FRED_SERIES["pce_yoy"], use_cache),
-            "core_pce_yoy": self.get_yoy_change(FRED_SERIES["core_pce_yoy"], use_cache),
-            # Employment
-            "unemployment_rate": self.get_latest_value(FRED_SERIES["unemployment_rate"], use_cache),
-            "nonfarm_payrolls": self.get_latest_value(FRED_SERIES["nonfarm_payrolls"], use_cache),
-            "nonfarm_payrolls_mom": self.get_mom_change(FRED_SERIES["nonfarm_payrolls"], use_cache),
-            "labor_force_participation": self.get_latest_value(
-                FRED_SERIES["labor_force_participation"], use_cache
-            ),
-            "wage_growth_yoy": self.get_yoy_change(FRED_SERIES["wage_growth_yoy"], use_cache),
-            "job_openings": self.get_latest_value(FRED_SERIES["job_openings"], use_cache),
-            "initial_claims": self.get_latest_value(FRED_SERIES["initial_claims"], use_cache),
-            # Activity
-            "gdp_growth": self.get_latest_value(FRED_SERIES["gdp_growth"], use_cache),
-            "retail_sales_mom": self.get_mom_change(FRED_SERIES["retail_sales_mom"], use_cache),
-            "industrial_production": self.get_latest_value(
-                FRED_SERIES["industrial_production"], use_cache
-            ),
-            "industrial_production_yoy": self.get_yoy_change(
-                FRED_SERIES["industrial_production"], use_cache
-            ),
-            "capacity_utilization": self.get_latest_value(
-                FRED_SERIES["capacity_utilization"], use_cache
-            ),
-            "housing_starts": self.get_latest_value(FRED_SERIES["housing_starts"], use_cache),
-            # Markets
-            "fed_funds_rate": self.get_latest_value(FRED_SERIES["fed_funds_rate"], use_cache),
-            "fed_funds_target_upper": self.get_latest_value(
-                FRED_SERIES["fed_funds_target_upper"], use_cache
-            ),
-            "fed_funds_target_lower": self.get_latest_value(
-                FRED_SERIES["fed_funds_target_lower"], use_cache
-            ),
-            "treasury_10y": self.get_latest_value(FRED_SERIES["treasury_10y"], use_cache),
-            "treasury_2y": self.get_latest_value(FRED_SERIES["treasury_2y"], use_cache),
-            "treasury_3m": self.get_latest_value(FRED_SERIES["treasury_3m"], use_cache),
-            "sp500": self.get_latest_value(FRED_SERIES["sp500"], use_cache),
-            # Expectations
-            "michigan_sentiment": self.get_latest_value(
-                FRED_SERIES["michigan_sentiment"], use_cache
-            ),
-            "breakeven_5y": self.get_latest_value(FRED_SERIES["breakeven_5y"], use_cache),
-            "breakeven_10y": self.get_latest_value(FRED_SERIES["breakeven_10y"], use_cache),
-        }
+        # One request per unique series; every metric is then derived locally.
+        # A failed fetch leaves its slot empty, which every derivation maps to
+        # its missing value (None or an empty IndicatorValue)
+        results: list[list[dict[str, Any]]] = [[] for _ in _SNAPSHOT_SERIES_IDS]
 
-        # Trend tasks for key indicators
-        trend_tasks = {
-            # Inflation trends (YoY values)
-            "trend_cpi_yoy": self.get_yoy_with_trend(FRED_SERIES["cpi_yoy"], use_cache),
-            "trend_core_cpi_yoy": self.get_yoy_with_trend(FRED_SERIES["core_cpi_yoy"], use_cache),
-            "trend_pce_yoy": self.get_yoy_with_trend(FRED_SERIES["pce_yoy"], use_cache),
-            "trend_core_pce_yoy": self.get_yoy_with_trend(FRED_SERIES["core_pce_yoy"], use_cache),
-            # Employment trends
-            "trend_unemployment_rate": self.get_indicator_with_trend(FRED_SERIES["unemployment_rate"], 3, use_cache),
-            "trend_labor_force_participation": self.get_indicator_with_trend(FRED_SERIES["labor_force_participation"], 3, use_cache),
-            "trend_wage_growth_yoy": self.get_yoy_with_trend(FRED_SERIES["wage_growth_yoy"], use_cache),
-            "trend_job_openings": self.get_indicator_with_trend(FRED_SERIES["job_openings"], 3, use_cache),
-            # Activity trends
-            "trend_gdp_growth": self.get_indicator_with_trend(FRED_SERIES["gdp_growth"], 3, use_cache),
-            "trend_retail_sales_mom": self.get_indicator_with_trend(FRED_SERIES["retail_sales_mom"], 3, use_cache),
-            "trend_industrial_production_yoy": self.get_yoy_with_trend(FRED_SERIES["industrial_production"], use_cache),
-            "trend_capacity_utilization": self.get_indicator_with_trend(FRED_SERIES["capacity_utilization"], 3, use_cache),
-            # Market trends
-            "trend_treasury_10y": self.get_indicator_with_trend(FRED_SERIES["treasury_10y"], 5, use_cache),
-            "trend_treasury_2y": self.get_indicator_with_trend(FRED_SERIES["treasury_2y"], 5, use_cache),
-            # Expectations trends
-            "trend_michigan_sentiment": self.get_indicator_with_trend(FRED_SERIES["michigan_sentiment"], 3, use_cache),
-            "trend_breakeven_5y": self.get_indicator_with_trend(FRED_SERIES["breakeven_5y"], 5, use_cache),
-            "trend_breakeven_10y": self.get_indicator_with_trend(FRED_SERIES["breakeven_10y"], 5, use_cache),
-        }
+        async def fetch_into(position: int, series_id: str) -> None:
+            with contextlib.suppress(Exception):
+                results[position] = await self._fetch_recent(series_id, use_cache)
 
-        # Execute all tasks concurrently (both main and trend tasks)
-        all_tasks = list(tasks.values()) + list(trend_tasks.values())
-        all_keys = list(tasks.keys()) + list(trend_tasks.keys())
-
-        results = await asyncio.gather(*all_tasks, return_exceptions=True)
-
-        # Map results back to keys
-        data = {}
-        trends = {}
-        for key, result in zip(all_keys, results):
-            if isinstance(result, Exception):
-                if key.startswith("trend_"):
-                    trends[key.replace("trend_", "")] = IndicatorValue()
-                else:
-                    data[key] = None
-            else:
-                if key.startswith("trend_"):
-                    trends[key.replace("trend_", "")] = result
-                else:
-                    data[key] = result
-
-        # Calculate nonfarm payrolls change (in thousands)
-        nonfarm_change = None
-        if data.get("nonfarm_payrolls_mom") is not None and data.get("nonfarm_payrolls") is not None:
-            # Convert percentage change to absolute change in thousands
-            nonfarm_change = (data["nonfarm_payrolls_mom"] / 100) * data["nonfarm_payrolls"]
-
-        # Build the indicators object
-        return EconomicIndicators(
-            as_of_date=as_of_date,
-            inflation=InflationIndicators(
-                cpi_yoy=data.get("cpi_yoy"),
-                core_cpi_yoy=data.get("core_cpi_yoy"),
-                pce_yoy=data.get("pce_yoy"),
-                core_pce_yoy=data.get("core_pce_yoy"),
-            ),
-            employment=EmploymentIndicators(
-                unemployment_rate=data.get("unemployment_rate"),
-                nonfarm_payrolls=data.get("nonfarm_payrolls"),
-                nonfarm_payrolls_change=nonfarm_change,
-                labor_force_participation=data.get("labor_force_participation"),
-                wage_growth_yoy=data.get("wage_growth_yoy"),
-                job_openings=data.get("job_openings"),
-                initial_claims=data.get("initial_claims"),
-            ),
-            activity=ActivityIndicators(
-                gdp_growth=data.get("gdp_growth"),
-                retail_sales_mom=data.get("retail_sales_mom"),
-                industrial_production=data.get("industrial_production"),
-                industrial_production_yoy=data.get("industrial_production_yoy"),
-                capacity_utilization=data.get("capacity_utilization"),
-                housing_starts=data.get("housing_starts"),
-            ),
-            markets=MarketIndicators(
-                fed_funds_rate=data.get("fed_funds_rate"),
-                fed_funds_target_upper=data.get("fed_funds_target_upper"),
-                fed_funds_target_lower=data.get("fed_funds_target_lower"),
-                treasury_10y=data.get("treasury_10y"),
-                treasury_2y=data.get("treasury_2y"),
-                treasury_3m=data.get("treasury_3m"),
-                sp500=data.get("sp500"),
-            ),
-            expectations=ExpectationsIndicators(
-                michigan_sentiment=data.get("michigan_sentiment"),
-                breakeven_5y=data.get("breakeven_5y"),
-                breakeven_10y=data.get("breakeven_10y"),
-            ),
-            trends=trends,
-        )
+        async with asyncio.TaskGroup() as tg:
+            for position, series_id in enumerate(_SNAPSHOT_SERIES_IDS):
+                tg.create_task(fetch_into(position, series_id))
 
-    def _get_indicator_key(self, series_id: str) -> str:
-        """Get the indicator key from a FRED series ID."""
-        for key, sid in FRED_SERIES.items():
-            if sid == series_id:
-                return key
-        return ""
+        # Deriving every metric and validating the models is CPU work; keep it
+        # off the event loop so other coroutines aren't stalled meanwhile
+        return await asyncio.to_thread(_build_indicators, as_of_date, results)
 
     def clear_cache(self) -> int:
         """Clear all cached data."""
@@ -1,14 +1,18 @@
 """Fetch actual Fed decisions from FRED API."""
 
+import asyncio
+from bisect import bisect_left
 from dataclasses import dataclass
 from datetime import date, timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+from fed_board.data.fred import parse_observations
 
 if TYPE_CHECKING:
     from fed_board.data.fred import FREDClient
 
 
-@dataclass
+@dataclass(slots=True)
 class ActualDecision:
     """Represents an actual Fed decision."""
 
@@ -41,6 +45,130 @@ class ActualDecision:
             return "0 bps"
 
 
+def _parse_rates(observations: list[dict[str, Any]]) -> tuple[list[date], list[float]]:
+    """
+    Parse target-rate observations, dropping missing values.
+
+    Args:
+        observations: Daily target-rate observations sorted by ascending date
+
+    Returns:
+        Tuple of (dates, rates) in ascending date order
+    """
+    values, dates = parse_observations(observations)
+    present = [
+        (obs_date, value)
+        for obs_date, value in zip(dates, values, strict=True)
+        if value is not None
+    ]
+    return [obs_date for obs_date, _ in present], [value for _, value in present]
+
+
+def _rates_around(
+    rates: tuple[list[date], list[float]],
+    meeting_date: date,
+) -> tuple[float | None, float | None]:
+    """
+    Find the target rate in effect before a meeting and the one set at it.
+
+    Args:
+        rates: Parsed (dates, rates) in ascending date order
+        meeting_date: The date of the FOMC meeting
+
+    Returns:
+        Tuple of (last rate before the meeting, first rate on or after it)
+    """
+    # The rate changes are announced on the meeting date
+    dates, values = rates
+    idx = bisect_left(dates, meeting_date)
+    previous = values[idx - 1] if idx > 0 else None
+    new = values[idx] if idx < len(values) else None
+    return previous, new
+
+
+async def _fetch_target_rates(
+    fred_client: "FREDClient",
+    start_date: date,
+    end_date: date,
+    limit: int,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """
+    Fetch the upper (DFEDTARU) and lower (DFEDTARL) target rates concurrently.
+
+    Args:
+        fred_client: FREDClient instance
+        start_date: First date to fetch
+        end_date: Last date to fetch
+        limit: Maximum number of observations per series
+
+    Returns:
+        Tuple of (upper, lower) observations sorted by ascending date
+    """
+    upper_obs, lower_obs = await asyncio.gather(
+        *(
+            fred_client.get_series(
+                series_id,
+                start_date=start_date,
+                end_date=end_date,
+                limit=limit,
+                sort_order="asc",
+                use_cache=True,
+            )
+            for series_id in ("DFEDTARU", "DFEDTARL")
+        )
+    )
+    return upper_obs, lower_obs
+
+
+def _decision_from_rates(
+    upper: tuple[list[date], list[float]],
+    lower: tuple[list[date], list[float]],
+    meeting_date: date,
+) -> ActualDecision | None:
+    """
+    Work out the decision taken at a meeting from parsed target rates.
+
+    Args:
+        upper: Parsed upper target (dates, rates) in ascending date order
+        lower: Parsed lower target (dates, rates) in ascending date order
+        meeting_date: The date of the FOMC meeting
+
+    Returns:
+        ActualDecision with the rate change, or None if the window lacks data
+    """
+    # Find the rate before and after the meeting date
+    prev_upper, new_upper = _rates_around(upper, meeting_date)
+    prev_lower, new_lower = _rates_around(lower, meeting_date)
+
+    # If we couldn't find the rates, return None
+    if prev_upper is None or prev_lower is None or new_upper is None or new_lower is None:
+        return None
+
+    # Calculate the change in basis points
+    # Use midpoint comparison
+    prev_mid = (prev_upper + prev_lower) / 2
+    new_mid = (new_upper + new_lower) / 2
+    change_bps = int(round((new_mid - prev_mid) * 100))
+
+    # Determine decision type
+    if change_bps > 0:
+        decision_type = "RAISE"
+    elif change_bps < 0:
+        decision_type = "CUT"
+    else:
+        decision_type = "HOLD"
+
+    return ActualDecision(
+        meeting_date=meeting_date,
+        rate_lower=new_lower,
+        rate_upper=new_upper,
+        previous_lower=prev_lower,
+        previous_upper=prev_upper,
+        change_bps=change_bps,
+        decision_type=decision_type,
+    )
+
+
 async def get_actual_decision(
     fred_client: "FREDClient",
     meeting_date: date,
@@ -63,86 +191,12 @@ async def get_actual_decision(
     end_date = meeting_date + timedelta(days=5)
 
     try:
-        # Fetch upper and lower target rates
-        upper_obs = await fred_client.get_series(
-            "DFEDTARU",
-            start_date=start_date,
-            end_date=end_date,
-            limit=50,
-            sort_order="asc",
-            use_cache=True,
+        upper_obs, lower_obs = await _fetch_target_rates(
+            fred_client, start_date, end_date, limit=50
         )
-        lower_obs = await fred_client.get_series(
-            "DFEDTARL",
-            start_date=start_date,
-            end_date=end_date,
-            limit=50,
-            sort_order="asc",
-            use_cache=True,
+        return _decision_from_rates(
+            _parse_rates(upper_obs), _parse_rates(lower_obs), meeting_date
         )
-
-        if not upper_obs or not lower_obs:
-            return None
-
-        # Find the rate before and after the meeting date
-        # The rate changes are announced on the meeting date
-        prev_upper = None
-        prev_lower = None
-        new_upper = None
-        new_lower = None
-
-        for obs in upper_obs:
-            obs_date = date.fromisoformat(obs["date"])
-            value = float(obs["value"]) if obs["value"] != "." else None
-
-            if value is None:
-                continue
-
-            if obs_date < meeting_date:
-                prev_upper = value
-            elif obs_date >= meeting_date and new_upper is None:
-                new_upper = value
-
-        for obs in lower_obs:
-            obs_date = date.fromisoformat(obs["date"])
-            value = float(obs["value"]) if obs["value"] != "." else None
-
-            if value is None:
-                continue
-
-            if obs_date < meeting_date:
-                prev_lower = value
-            elif obs_date >= meeting_date and new_lower is None:
-                new_lower = value
-
-        # If we couldn't find the rates, return None
-        if any(v is None for v in [prev_upper, prev_lower, new_upper, new_lower]):
-            return None
-
-        # Calculate the change in basis points
-        # Use midpoint comparison
-        prev_mid = (prev_upper + prev_lower) / 2
-        new_mid = (new_upper + new_lower) / 2
-        change_bps = int(round((new_mid - prev_mid) * 100))
-
-        # Determine decision type
-        if change_bps > 0:
-            decision_type = "RAISE"
-        elif change_bps < 0:
-            decision_type = "CUT"
-        else:
-            decision_type = "HOLD"
-
-        return ActualDecision(
-            meeting_date=meeting_date,
-            rate_lower=new_lower,
-            rate_upper=new_upper,
-            previous_lower=prev_lower,
-            previous_upper=prev_upper,
-            change_bps=change_bps,
-            decision_type=decision_type,
-        )
-
     except Exception:
         return None
 
@@ -163,15 +217,28 @@ async def get_actual_decisions_for_year(
     """
     from fed_board.data.fomc_schedule import get_all_fomc_dates
 
-    decisions = []
-    meeting_dates = get_all_fomc_dates(year)
+    # Skip future meetings
+    today = date.today()
+    meeting_dates = [d for d in get_all_fomc_dates(year) if d <= today]
+    if not meeting_dates:
+        return []
 
-    for meeting_date in meeting_dates:
-        # Skip future meetings
-        if meeting_date > date.today():
-            continue
+    # The target rates are continuous daily series, so fetch the whole year
+    # once and slice it per meeting rather than a window per meeting
+    start_date = meeting_dates[0] - timedelta(days=7)
+    end_date = meeting_dates[-1] + timedelta(days=5)
+    try:
+        upper_obs, lower_obs = await _fetch_target_rates(
+            fred_client, start_date, end_date, limit=(end_date - start_date).days + 1
+        )
+        upper = _parse_rates(upper_obs)
+        lower = _parse_rates(lower_obs)
+    except Exception:
+        return []
 
-        decision = await get_actual_decision(fred_client, meeting_date)
+    decisions = []
+    for meeting_date in meeting_dates:
+        decision = _decision_from_rates(upper, lower, meeting_date)
         if decision:
             decisions.append(decision)
 
@@ -1,10 +1,11 @@
 """Economic indicators data models and FRED series mappings."""
 
+from collections.abc import Mapping
 from datetime import date
 from enum import Enum
-from typing import Annotated
+from typing import Annotated, Any, Self
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, computed_field
 
 
 class Trend(str, Enum):
@@ -21,27 +22,34 @@ class Trend(str, Enum):
     @property
     def arrow(self) -> str:
         """Get arrow symbol for the trend."""
-        return {
-            Trend.RISING: "↑",
-            Trend.FALLING: "↓",
-            Trend.STABLE: "→",
-            Trend.UNKNOWN: "?",
-        }[self]
+        return _TREND_ARROWS[self]
 
     @property
     def color(self) -> str:
         """Get color for Rich formatting."""
-        return {
-            Trend.RISING: "green",
-            Trend.FALLING: "red",
-            Trend.STABLE: "yellow",
-            Trend.UNKNOWN: "dim",
-        }[self]
+        return _TREND_COLORS[self]
+
+
+_TREND_ARROWS: dict[Trend, str] = {
+    Trend.RISING: "↑",
+    Trend.FALLING: "↓",
+    Trend.STABLE: "→",
+    Trend.UNKNOWN: "?",
+}
+
+_TREND_COLORS: dict[Trend, str] = {
+    Trend.RISING: "green",
+    Trend.FALLING: "red",
+    Trend.STABLE: "yellow",
+    Trend.UNKNOWN: "dim",
+}
 
 
 class IndicatorValue(BaseModel):
     """A single indicator with current value, history, and trend."""
 
+    model_config = ConfigDict(frozen=True)
+
     current: float | None = Field(default=None, description="Current/latest value")
     previous: float | None = Field(default=None, description="Previous period value")
     two_periods_ago: float | None = Field(default=None, description="Value from 2 periods ago")
@@ -66,14 +74,14 @@ class IndicatorValue(BaseModel):
         if not values:
             return cls()
 
-        current = values[0] if len(values) > 0 else None
+        current = values[0]
         previous = values[1] if len(values) > 1 else None
         two_ago = values[2] if len(values) > 2 else None
-        data_date = dates[0] if dates and len(dates) > 0 else None
+        data_date = dates[0] if dates else None
 
         # Calculate trend
         trend = Trend.UNKNOWN
-        if current is not None and previous is not None:
+        if previous is not None:
             if previous != 0:
                 pct_change = ((current - previous) / abs(previous)) * 100
                 if pct_change > threshold_pct:
@@ -205,6 +213,8 @@ FRED_FREQUENCIES: dict[str, str] = {
 class InflationIndicators(BaseModel):
     """Inflation-related economic indicators."""
 
+    model_config = ConfigDict(frozen=True)
+
     cpi_yoy: Annotated[
         float | None,
         Field(description="Consumer Price Index, Year-over-Year %"),
@@ -237,6 +247,8 @@ class InflationIndicators(BaseModel):
 class EmploymentIndicators(BaseModel):
     """Employment-related economic indicators."""
 
+    model_config = ConfigDict(frozen=True)
+
     unemployment_rate: Annotated[
         float | None,
         Field(description="Unemployment Rate %"),
@@ -283,6 +295,8 @@ class EmploymentIndicators(BaseModel):
 class ActivityIndicators(BaseModel):
     """Economic activity indicators."""
 
+    model_config = ConfigDict(frozen=True)
+
     gdp_growth: Annotated[
         float | None,
         Field(description="GDP Growth Rate (QoQ annualized) %"),
@@ -327,6 +341,8 @@ class ActivityIndicators(BaseModel):
 class MarketIndicators(BaseModel):
     """Financial market indicators."""
 
+    model_config = ConfigDict(frozen=True)
+
     fed_funds_rate: Annotated[
         float | None,
         Field(description="Effective Federal Funds Rate %"),
@@ -389,6 +405,8 @@ class MarketIndicators(BaseModel):
 class ExpectationsIndicators(BaseModel):
     """Market expectations and sentiment indicators."""
 
+    model_config = ConfigDict(frozen=True)
+
     michigan_sentiment: Annotated[
         float | None,
         Field(description="University of Michigan Consumer Sentiment Index"),
@@ -414,6 +432,8 @@ class ExpectationsIndicators(BaseModel):
 class EconomicIndicators(BaseModel):
     """Complete snapshot of economic indicators for FOMC decision-making."""
 
+    model_config = ConfigDict(frozen=True)
+
     # Data date
     as_of_date: date = Field(
         ...,
@@ -448,63 +468,46 @@ class EconomicIndicators(BaseModel):
         description="Trend data with historical values for key indicators",
     )
 
-    def _get_trend_str(self, key: str) -> str:
-        """Get trend arrow for a key if available."""
-        if key in self.trends and self.trends[key].trend != Trend.UNKNOWN:
-            return f" {self.trends[key].trend.arrow}"
-        return ""
-
-    def _get_prev_str(self, key: str) -> str:
-        """Get previous values string for a key if available."""
-        if key not in self.trends:
-            return ""
-        t = self.trends[key]
-        prev_vals = []
-        if t.previous is not None:
-            prev_vals.append(f"{t.previous:.1f}")
-        if t.two_periods_ago is not None:
-            prev_vals.append(f"{t.two_periods_ago:.1f}")
-        if prev_vals:
-            return f" (prev: {', '.join(prev_vals)})"
-        return ""
+    # Every agent asks for the briefing of the same snapshot, and snapshots
+    # are frozen once built, so render it once
+    _briefing: str | None = PrivateAttr(default=None)
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the snapshot, dropping the cached briefing if any field changes."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied._briefing = None
+        return copied
 
     def to_briefing(self) -> str:
         """Generate a briefing document for FOMC members."""
-        lines = [
-            f"# Economic Briefing - As of {self.as_of_date.strftime('%B %d, %Y')}",
-            "",
-            "## Inflation",
-            f"- Core PCE (Fed's preferred measure): {self._fmt(self.inflation.core_pce_yoy, '%')}{self._get_trend_str('core_pce_yoy')}{self._get_prev_str('core_pce_yoy')}",
-            f"- Core CPI: {self._fmt(self.inflation.core_cpi_yoy, '%')}{self._get_trend_str('core_cpi_yoy')}{self._get_prev_str('core_cpi_yoy')}",
-            f"- Headline CPI: {self._fmt(self.inflation.cpi_yoy, '%')}{self._get_trend_str('cpi_yoy')}{self._get_prev_str('cpi_yoy')}",
-            f"- PCE Price Index: {self._fmt(self.inflation.pce_yoy, '%')}{self._get_trend_str('pce_yoy')}{self._get_prev_str('pce_yoy')}",
-            "",
-            "## Labor Market",
-            f"- Unemployment Rate: {self._fmt(self.employment.unemployment_rate, '%')}{self._get_trend_str('unemployment_rate')}{self._get_prev_str('unemployment_rate')}",
-            f"- Nonfarm Payrolls Change: {self._fmt(self.employment.nonfarm_payrolls_change, 'K', signed=True)}",
-            f"- Labor Force Participation: {self._fmt(self.employment.labor_force_participation, '%')}{self._get_trend_str('labor_force_participation')}{self._get_prev_str('labor_force_participation')}",
-            f"- Wage Growth (YoY): {self._fmt(self.employment.wage_growth_yoy, '%')}{self._get_trend_str('wage_growth_yoy')}{self._get_prev_str('wage_growth_yoy')}",
-            f"- Job Openings: {self._fmt(self.employment.job_openings, 'K')}{self._get_trend_str('job_openings')}",
-            "",
-            "## Economic Activity",
-            f"- GDP Growth (QoQ annualized): {self._fmt(self.activity.gdp_growth, '%', signed=True)}{self._get_trend_str('gdp_growth')}{self._get_prev_str('gdp_growth')}",
-            f"- Retail Sales (MoM): {self._fmt(self.activity.retail_sales_mom, '%', signed=True)}{self._get_trend_str('retail_sales_mom')}",
-            f"- Industrial Production (YoY): {self._fmt(self.activity.industrial_production_yoy, '%', signed=True)}{self._get_trend_str('industrial_production_yoy')}{self._get_prev_str('industrial_production_yoy')}",
-            f"- Capacity Utilization: {self._fmt(self.activity.capacity_utilization, '%')}{self._get_trend_str('capacity_utilization')}",
-            "",
-            "## Financial Markets",
-            f"- Current Fed Funds Target: {self.markets.current_rate_range or 'N/A'}",
-            f"- 10-Year Treasury: {self._fmt(self.markets.treasury_10y, '%')}{self._get_trend_str('treasury_10y')}",
-            f"- 2-Year Treasury: {self._fmt(self.markets.treasury_2y, '%')}{self._get_trend_str('treasury_2y')}",
-            f"- 10Y-2Y Spread: {self._fmt(self.markets.yield_curve_spread, 'bps', mult=100, signed=True)}",
-            f"- S&P 500 YTD: {self._fmt(self.markets.sp500_ytd, '%', signed=True)}",
-            "",
-            "## Expectations",
-            f"- Consumer Sentiment: {self._fmt(self.expectations.michigan_sentiment)}{self._get_trend_str('michigan_sentiment')}{self._get_prev_str('michigan_sentiment')}",
-            f"- 5-Year Breakeven Inflation: {self._fmt(self.expectations.breakeven_5y, '%')}{self._get_trend_str('breakeven_5y')}",
-            f"- 10-Year Breakeven Inflation: {self._fmt(self.expectations.breakeven_10y, '%')}{self._get_trend_str('breakeven_10y')}",
-        ]
-        return "\n".join(lines)
+        if self._briefing is None:
+            self._briefing = self._render_briefing()
+        return self._briefing
+
+    def _render_briefing(self) -> str:
+        """Render the briefing document."""
+        fields = {
+            "as_of_date": self.as_of_date.strftime("%B %d, %Y"),
+            "current_rate_range": self.markets.current_rate_range or "N/A",
+            "yield_curve_spread": self._fmt(
+                self.markets.yield_curve_spread, "bps", mult=100, signed=True
+            ),
+        }
+        for group, name, suffix, signed, show_trend, show_prev in _BRIEFING_FIELDS:
+            text = self._fmt(getattr(getattr(self, group), name), suffix, signed=signed)
+            trend = self.trends.get(name) if show_trend else None
+            if trend is not None:
+                if trend.trend != Trend.UNKNOWN:
+                    text += f" {trend.trend.arrow}"
+                if show_prev:
+                    prev_vals = [
+                        f"{v:.1f}" for v in (trend.previous, trend.two_periods_ago) if v is not None
+                    ]
+                    if prev_vals:
+                        text += f" (prev: {', '.join(prev_vals)})"
+            fields[name] = text
+        return _BRIEFING_TEMPLATE.format_map(fields)
 
     @staticmethod
     def _fmt(
@@ -520,3 +523,62 @@ class EconomicIndicators(BaseModel):
         if signed:
             return f"{val:+.1f}{suffix}"
         return f"{val:.1f}{suffix}"
+
+
+_BRIEFING_TEMPLATE = """\
+# Economic Briefing - As of {as_of_date}
+
+## Inflation
+- Core PCE (Fed's preferred measure): {core_pce_yoy}
+- Core CPI: {core_cpi_yoy}
+- Headline CPI: {cpi_yoy}
+- PCE Price Index: {pce_yoy}
+
+## Labor Market
+- Unemployment Rate: {unemployment_rate}
+- Nonfarm Payrolls Change: {nonfarm_payrolls_change}
+- Labor Force Participation: {labor_force_participation}
+- Wage Growth (YoY): {wage_growth_yoy}
+- Job Openings: {job_openings}
+
+## Economic Activity
+- GDP Growth (QoQ annualized): {gdp_growth}
+- Retail Sales (MoM): {retail_sales_mom}
+- Industrial Production (YoY): {industrial_production_yoy}
+- Capacity Utilization: {capacity_utilization}
+
+## Financial Markets
+- Current Fed Funds Target: {current_rate_range}
+- 10-Year Treasury: {treasury_10y}
+- 2-Year Treasury: {treasury_2y}
+- 10Y-2Y Spread: {yield_curve_spread}
+- S&P 500 YTD: {sp500_ytd}
+
+## Expectations
+- Consumer Sentiment: {michigan_sentiment}
+- 5-Year Breakeven Inflation: {breakeven_5y}
+- 10-Year Breakeven Inflation: {breakeven_10y}"""
+
+# (group, field, suffix, signed, show trend arrow, show previous values) per briefing
+# line; the field name doubles as the template placeholder and the trends key
+_BRIEFING_FIELDS: tuple[tuple[str, str, str, bool, bool, bool], ...] = (
+    ("inflation", "core_pce_yoy", "%", False, True, True),
+    ("inflation", "core_cpi_yoy", "%", False, True, True),
+    ("inflation", "cpi_yoy", "%", False, True, True),
+    ("inflation", "pce_yoy", "%", False, True, True),
+    ("employment", "unemployment_rate", "%", False, True, True),
+    ("employment", "nonfarm_payrolls_change", "K", True, False, False),
+    ("employment", "labor_force_participation", "%", False, True, True),
+    ("employment", "wage_growth_yoy", "%", False, True, True),
+    ("employment", "job_openings", "K", False, True, False),
+    ("activity", "gdp_growth", "%", True, True, True),
+    ("activity", "retail_sales_mom", "%", True, True, False),
+    ("activity", "industrial_production_yoy", "%", True, True, True),
+    ("activity", "capacity_utilization", "%", False, True, False),
+    ("markets", "treasury_10y", "%", False, True, False),
+    ("markets", "treasury_2y", "%", False, True, False),
+    ("markets", "sp500_ytd", "%", True, False, False),
+    ("expectations", "michigan_sentiment", "", False, True, True),
+    ("expectations", "breakeven_5y", "%", False, True, False),
+    ("expectations", "breakeven_10y", "%", False, True, False),
+)
@@ -1,10 +1,12 @@
 """FOMC meeting data models."""
 
+from collections.abc import Mapping
 from datetime import date, datetime
 from enum import Enum
-from typing import Annotated
+from functools import cached_property
+from typing import Annotated, Any, Self
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, computed_field
 
 from fed_board.data.indicators import EconomicIndicators
 from fed_board.models.member import FOMCMember, MemberVotePreference
@@ -24,6 +26,8 @@ class RateDecision(str, Enum):
 class Vote(BaseModel):
     """Individual vote cast by an FOMC member."""
 
+    model_config = ConfigDict(frozen=True)
+
     member_name: str = Field(
         ...,
         description="Name of the voting member",
@@ -57,6 +61,8 @@ class Vote(BaseModel):
 class Decision(BaseModel):
     """The final FOMC rate decision."""
 
+    model_config = ConfigDict(frozen=True)
+
     rate_decision: RateDecision = Field(
         ...,
         description="Type of rate decision (raise/hold/cut)",
@@ -102,14 +108,22 @@ class Decision(BaseModel):
         ),
     ]
 
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the decision, dropping cached range strings if the rates change."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.__dict__.pop("rate_range_str", None)
+            copied.__dict__.pop("previous_rate_range_str", None)
+        return copied
+
     @computed_field
-    @property
+    @cached_property
     def rate_range_str(self) -> str:
         """Format the rate range as a string."""
         return f"{self.new_rate_lower:.2f}-{self.new_rate_upper:.2f}%"
 
     @computed_field
-    @property
+    @cached_property
     def previous_rate_range_str(self) -> str:
         """Format the previous rate range as a string."""
         return f"{self.previous_rate_lower:.2f}-{self.previous_rate_upper:.2f}%"
@@ -118,6 +132,8 @@ class Decision(BaseModel):
 class RateProjection(BaseModel):
     """Individual member's rate projection for the dot plot."""
 
+    model_config = ConfigDict(frozen=True)
+
     member_name: str = Field(
         ...,
         description="Name of the projecting member",
@@ -192,6 +208,8 @@ class MarketImpact(BaseModel):
 class DissentAnalysis(BaseModel):
     """Analysis of dissenting votes."""
 
+    model_config = ConfigDict(frozen=True)
+
     dissenter_name: str = Field(
         ...,
         description="Name of the dissenting member",
@@ -221,6 +239,8 @@ class DissentAnalysis(BaseModel):
 class Meeting(BaseModel):
     """Represents an FOMC meeting."""
 
+    model_config = ConfigDict(frozen=True)
+
     meeting_date: date = Field(
         ...,
         description="Date of the meeting (first day if multi-day)",
@@ -234,14 +254,22 @@ class Meeting(BaseModel):
         description="Whether this is a regularly scheduled meeting",
     )
 
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the meeting, dropping cached date strings if the dates change."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.__dict__.pop("month_str", None)
+            copied.__dict__.pop("display_date", None)
+        return copied
+
     @computed_field
-    @property
+    @cached_property
     def month_str(self) -> str:
         """Get the month string for this meeting (YYYY-MM)."""
         return self.meeting_date.strftime("%Y-%m")
 
     @computed_field
-    @property
+    @cached_property
     def display_date(self) -> str:
         """Get a formatted display date."""
         if self.meeting_end_date:
@@ -252,6 +280,8 @@ class Meeting(BaseModel):
 class MeetingResult(BaseModel):
     """Complete results of an FOMC meeting simulation."""
 
+    model_config = ConfigDict(frozen=True)
+
     meeting: Meeting = Field(
         ...,
         description="Meeting information",
@@ -309,17 +339,40 @@ class MeetingResult(BaseModel):
         description="AI model used for the simulation",
     )
 
+    # Tallied once after validation; the result is frozen, so the tally can't go stale
+    _vote_count_for: int = PrivateAttr(default=0)
+    _dissenter_names: tuple[str, ...] = PrivateAttr(default=())
+
+    def model_post_init(self, __context: Any) -> None:
+        """Tally the votes in one pass so the properties below don't rescan them."""
+        vote_count_for = 0
+        dissenters = []
+        for v in self.votes:
+            if v.vote_for_decision:
+                vote_count_for += 1
+            if v.is_dissent:
+                dissenters.append(v.member_name)
+        self._vote_count_for = vote_count_for
+        self._dissenter_names = tuple(dissenters)
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the result, re-tallying the votes if fields change."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.model_post_init(None)
+        return copied
+
     @computed_field
     @property
     def vote_count_for(self) -> int:
         """Count votes for the decision."""
-        return sum(1 for v in self.votes if v.vote_for_decision)
+        return self._vote_count_for
 
     @computed_field
     @property
     def vote_count_against(self) -> int:
         """Count dissenting votes."""
-        return sum(1 for v in self.votes if not v.vote_for_decision)
+        return len(self.votes) - self._vote_count_for
 
     @computed_field
     @property
@@ -327,8 +380,8 @@ class MeetingResult(BaseModel):
         """Get a summary of the vote."""
         if self.vote_count_against == 0:
             return f"Unanimous ({self.vote_count_for}-0)"
-        dissenters = [v.member_name for v in self.votes if v.is_dissent]
-        return f"{self.vote_count_for}-{self.vote_count_against} ({', '.join(dissenters)} dissented)"
+        dissenters = ", ".join(self._dissenter_names)
+        return f"{self.vote_count_for}-{self.vote_count_against} ({dissenters} dissented)"
 
     @computed_field
     @property
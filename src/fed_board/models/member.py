@@ -1,23 +1,21 @@
 """FOMC member data models."""
 
-from enum import Enum
-from typing import Annotated
+from collections.abc import Mapping
+from enum import StrEnum
+from typing import Annotated, Any, Self
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
-class Stance(str, Enum):
+class Stance(StrEnum):
     """Policy stance of an FOMC member."""
 
     HAWK = "hawk"
     DOVE = "dove"
     NEUTRAL = "neutral"
 
-    def __str__(self) -> str:
-        return self.value
 
-
-class Role(str, Enum):
+class Role(StrEnum):
     """Role of an FOMC member."""
 
     CHAIR = "Chair"
@@ -26,11 +24,14 @@ class Role(str, Enum):
     GOVERNOR = "Governor"
     PRESIDENT = "Reserve Bank President"
 
-    def __str__(self) -> str:
-        return self.value
+
+# Board members (as opposed to Reserve Bank presidents)
+_GOVERNOR_ROLES = frozenset(
+    {Role.CHAIR, Role.VICE_CHAIR, Role.VICE_CHAIR_SUPERVISION, Role.GOVERNOR}
+)
 
 
-class CommunicationStyle(str, Enum):
+class CommunicationStyle(StrEnum):
     """Communication style of an FOMC member."""
 
     MEASURED = "measured"
@@ -39,13 +40,12 @@ class CommunicationStyle(str, Enum):
     DATA_DRIVEN = "data-driven"
     PRAGMATIC = "pragmatic"
 
-    def __str__(self) -> str:
-        return self.value
-
 
 class FOMCMember(BaseModel):
     """Represents an FOMC member with their characteristics and voting history."""
 
+    model_config = ConfigDict(frozen=True)
+
     # Basic Information
     name: str = Field(
         ...,
@@ -72,8 +72,8 @@ class FOMCMember(BaseModel):
         default=True,
         description="Whether this member currently has voting rights",
     )
-    voting_years: list[int] = Field(
-        default_factory=list,
+    voting_years: tuple[int, ...] = Field(
+        default=(),
         description="Years when this Reserve Bank president has voting rights",
     )
 
@@ -83,7 +83,7 @@ class FOMCMember(BaseModel):
         description="General policy stance (hawk/dove/neutral)",
     )
     priorities: Annotated[
-        list[str],
+        tuple[str, ...],
         Field(
             min_length=1,
             max_length=5,
@@ -102,13 +102,13 @@ class FOMCMember(BaseModel):
         ge=0,
         description="Number of times this member has dissented from the majority",
     )
-    key_concerns: list[str] = Field(
-        default_factory=list,
+    key_concerns: tuple[str, ...] = Field(
+        default=(),
         description="Specific economic concerns this member emphasizes",
         examples=[["inflation expectations", "wage-price spiral"]],
     )
-    notable_quotes: list[str] = Field(
-        default_factory=list,
+    notable_quotes: tuple[str, ...] = Field(
+        default=(),
         description="Notable quotes that capture the member's views",
     )
 
@@ -117,30 +117,42 @@ class FOMCMember(BaseModel):
         default="",
         description="Brief professional background",
     )
-    expertise_areas: list[str] = Field(
-        default_factory=list,
+    expertise_areas: tuple[str, ...] = Field(
+        default=(),
         description="Areas of economic expertise",
     )
 
+    _is_governor: bool = PrivateAttr(default=False)
+    _is_new_york: bool = PrivateAttr(default=False)
+    _voting_year_set: frozenset[int] = PrivateAttr(default=frozenset())
+
+    def model_post_init(self, __context: Any) -> None:
+        """Precompute the role checks used by is_voting_in_year."""
+        self._is_governor = self.role in _GOVERNOR_ROLES
+        self._is_new_york = "New York" in self.bank
+        self._voting_year_set = frozenset(self.voting_years)
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the member, recomputing the precomputed checks if fields change."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.model_post_init(None)
+        return copied
+
     def is_voting_in_year(self, year: int) -> bool:
         """Check if this member has voting rights in a given year."""
-        if self.role in [Role.CHAIR, Role.VICE_CHAIR, Role.VICE_CHAIR_SUPERVISION, Role.GOVERNOR]:
+        if self._is_governor:
             return self.is_voting_member
         # NY Fed President always votes
-        if "New York" in self.bank:
+        if self._is_new_york:
             return True
         # Other Reserve Bank presidents rotate
-        return year in self.voting_years
+        return year in self._voting_year_set
 
     @property
     def is_governor(self) -> bool:
         """Check if this member is a Board Governor."""
-        return self.role in [
-            Role.CHAIR,
-            Role.VICE_CHAIR,
-            Role.VICE_CHAIR_SUPERVISION,
-            Role.GOVERNOR,
-        ]
+        return self._is_governor
 
     @property
     def is_reserve_bank_president(self) -> bool:
@@ -158,6 +170,8 @@ class FOMCMember(BaseModel):
 class MemberVotePreference(BaseModel):
     """A member's preferred rate decision and reasoning."""
 
+    model_config = ConfigDict(frozen=True)
+
     member: FOMCMember
     preferred_rate_change: Annotated[
         float,
@@ -179,8 +193,8 @@ class MemberVotePreference(BaseModel):
         ...,
         description="Detailed reasoning for the vote",
     )
-    key_factors: list[str] = Field(
-        default_factory=list,
+    key_factors: tuple[str, ...] = Field(
+        default=(),
         description="Key economic factors influencing the decision",
     )
     confidence: Annotated[
@@ -1,11 +1,33 @@
 """Output generation for minutes, PDFs, and charts."""
 
-from fed_board.outputs.minutes import MinutesGenerator
-from fed_board.outputs.pdf import PDFGenerator
-from fed_board.outputs.dotplot import DotPlotGenerator
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from fed_board.outputs.dotplot import DotPlotGenerator
+    from fed_board.outputs.minutes import MinutesGenerator
+    from fed_board.outputs.pdf import PDFGenerator
+
+# Generators are imported on first access so that, e.g., generating minutes
+# doesn't pull in matplotlib or WeasyPrint
+_LAZY_EXPORTS = {
+    "MinutesGenerator": "fed_board.outputs.minutes",
+    "PDFGenerator": "fed_board.outputs.pdf",
+    "DotPlotGenerator": "fed_board.outputs.dotplot",
+}
 
 __all__ = [
     "MinutesGenerator",
     "PDFGenerator",
     "DotPlotGenerator",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a generator the first time it is accessed."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
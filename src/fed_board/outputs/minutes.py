@@ -2,10 +2,9 @@
 
 from pathlib import Path
 
-from fed_board.agents.personas import FOMC_MEMBERS, get_voting_members
+from fed_board.agents.personas import get_attendance_groups
 from fed_board.config import Settings, get_settings
 from fed_board.models.meeting import MeetingResult
-from fed_board.models.member import Role
 
 
 class MinutesGenerator:
@@ -402,66 +401,42 @@ The staff continued to judge that uncertainty around the baseline projection rem
 
     def _build_attendance_section(self, year: int) -> str:
         """Build the attendance section listing all participants."""
-        # Separate members by role
-        chair = None
-        vice_chair = None
-        vice_chair_supervision = None
-        governors = []
-        ny_president = None
-        voting_presidents = []
-        non_voting_presidents = []
-
-        for member in FOMC_MEMBERS:
-            if member.role == Role.CHAIR:
-                chair = member
-            elif member.role == Role.VICE_CHAIR:
-                vice_chair = member
-            elif member.role == Role.VICE_CHAIR_SUPERVISION:
-                vice_chair_supervision = member
-            elif member.role == Role.GOVERNOR:
-                governors.append(member)
-            elif member.role == Role.PRESIDENT:
-                if "New York" in member.bank:
-                    ny_president = member
-                elif member.is_voting_in_year(year):
-                    voting_presidents.append(member)
-                else:
-                    non_voting_presidents.append(member)
+        groups = get_attendance_groups(year)
 
         lines = ["## Attendance", ""]
 
         # Chair and Vice Chairs
-        if chair:
-            lines.append(f"{chair.name}, Chair")
-        if vice_chair:
-            lines.append(f"{vice_chair.name}, Vice Chair")
-        if vice_chair_supervision:
-            lines.append(f"{vice_chair_supervision.name}, Vice Chair for Supervision")
+        if groups.chair:
+            lines.append(f"{groups.chair.name}, Chair")
+        if groups.vice_chair:
+            lines.append(f"{groups.vice_chair.name}, Vice Chair")
+        if groups.vice_chair_supervision:
+            lines.append(f"{groups.vice_chair_supervision.name}, Vice Chair for Supervision")
 
         # Governors
-        if governors:
-            gov_names = ", ".join([g.name for g in governors])
+        if groups.governors:
+            gov_names = ", ".join([g.name for g in groups.governors])
             lines.append(f"{gov_names}, Governors")
 
         lines.append("")
 
         # NY Fed President
-        if ny_president:
-            lines.append(f"{ny_president.name}, President, Federal Reserve Bank of New York")
+        if groups.ny_president:
+            lines.append(f"{groups.ny_president.name}, President, Federal Reserve Bank of New York")
 
         # Voting Reserve Bank Presidents
-        if voting_presidents:
+        if groups.voting_presidents:
             lines.append("")
             lines.append("*Voting Reserve Bank Presidents:*")
-            for pres in voting_presidents:
-                bank_name = pres.bank.replace("Federal Reserve Bank of ", "")
+            for pres in groups.voting_presidents:
+                bank_name = pres.bank.removeprefix("Federal Reserve Bank of ")
                 lines.append(f"{pres.name}, President, {bank_name}")
 
         # Non-voting Reserve Bank Presidents
-        if non_voting_presidents:
+        if groups.non_voting_presidents:
             lines.append("")
             lines.append("*Alternate Members of the Committee:*")
-            alt_names = ", ".join([p.name for p in non_voting_presidents[:4]])
+            alt_names = ", ".join([p.name for p in groups.non_voting_presidents[:4]])
             lines.append(alt_names)
 
         lines.append("")
@@ -1,14 +1,19 @@
 """PDF generator for FOMC meeting minutes in official Fed format."""
 
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from functools import lru_cache
+from html import escape
 from pathlib import Path
 
 from weasyprint import CSS, HTML
+from weasyprint.text.fonts import FontConfiguration
 
-from fed_board.agents.personas import FOMC_MEMBERS, get_voting_members
+from fed_board.agents.personas import get_attendance_groups
 from fed_board.config import Settings, get_settings
 from fed_board.models.meeting import MeetingResult
-from fed_board.models.member import Role
 from fed_board.outputs.minutes import MinutesGenerator
 
 
@@ -97,10 +102,6 @@ p {
     margin-bottom: 18pt;
 }
 
-hr {
-    display: none;
-}
-
 ul, ol {
     margin-left: 0.3in;
     margin-bottom: 12pt;
@@ -122,13 +123,9 @@ em {
     margin-top: 18pt;
 }
 
-.voting-for, .voting-against {
-    margin-bottom: 10pt;
-}
-
 .attendance-section {
     margin-top: 36pt;
-    page-break-before: always;
+    break-before: page;
 }
 
 .attendance-section h2 {
@@ -137,10 +134,6 @@ em {
     margin-bottom: 18pt;
 }
 
-.attendance-group {
-    margin-bottom: 12pt;
-}
-
 .attendance-group-title {
     font-style: italic;
     margin-bottom: 6pt;
@@ -182,11 +175,6 @@ em {
     color: #666;
 }
 
-.directive-quote {
-    margin: 14pt 0.5in;
-    font-size: 10pt;
-}
-
 blockquote {
     margin-left: 0.5in;
     margin-right: 0.5in;
@@ -201,6 +189,183 @@ sup {
 """
 
 
+# Staff sections that don't depend on the meeting
+_STAFF_FINANCIAL_HTML = """
+        <p>Over the intermeeting period, nominal Treasury yields showed modest movements
+        as market participants assessed incoming economic data and implications for
+        monetary policy. Changes in nominal yields reflected movements in both real
+        yields and inflation compensation.</p>
+
+        <p>In domestic credit markets, conditions remained generally supportive for
+        businesses and households. Financing conditions were somewhat restrictive for
+        some borrowers, particularly in sectors sensitive to interest rates. Large
+        businesses continued to access credit markets at a solid pace.</p>
+
+        <p>Credit performance remained stable in most markets. Delinquency rates for
+        consumer loans remained elevated in some categories but showed signs of
+        stabilization. Commercial real estate credit conditions continued to warrant
+        close monitoring given the ongoing adjustments in that sector.</p>
+
+        <p>Bank lending standards remained somewhat tight across most loan categories,
+        while loan demand showed mixed signals. Market-based financing remained available
+        for investment-grade borrowers at favorable terms.</p>
+        """
+
+_STAFF_OUTLOOK_HTML = """
+        <p>The staff projection for the U.S. economy anticipated continued moderate
+        growth in real GDP. The projection incorporated the assumption that financial
+        conditions would remain generally supportive of economic expansion while
+        monetary policy worked to bring inflation back to the Committee's 2 percent
+        objective.</p>
+
+        <p>The staff's inflation forecast anticipated a gradual return toward the
+        Committee's 2 percent longer-run objective, although the path was expected
+        to be uneven. Core inflation was projected to moderate as supply and demand
+        conditions continued to come into better balance.</p>
+
+        <p>The staff continued to judge that uncertainty around the baseline projection
+        remained elevated. Risks around the forecast for real activity were seen as
+        roughly balanced. Risks around the inflation forecast remained tilted to the
+        upside, given the possibility that inflation could prove more persistent than
+        expected.</p>
+        """
+
+# Closes the attendance section opened in _build_attendance_section
+_ATTENDANCE_FOOTNOTE_HTML = """
+            <div class="footnote">
+                <p><sup>1</sup> This AI simulation represents a hypothetical FOMC meeting
+                based on the economic conditions and member characteristics as of the
+                simulation date. Attendance reflects the current FOMC composition.</p>
+            </div>
+        </div>
+        """
+
+
+@lru_cache(maxsize=64)
+def _format_long_date(d: date) -> str:
+    """Format a date the way the minutes spell it, e.g. Tuesday, January 28, 2025."""
+    return d.strftime("%A, %B %d, %Y")
+
+
+@lru_cache(maxsize=64)
+def _opening_paragraph(start: date, end: date | None) -> str:
+    """Build the official opening paragraph for a meeting's dates."""
+    if end:
+        start_date = _format_long_date(start)
+        end_date = _format_long_date(end)
+        return (
+            f"A joint meeting of the Federal Open Market Committee and the Board of "
+            f"Governors of the Federal Reserve System was held in the offices of the "
+            f"Board of Governors on {start_date}, at 10:00 a.m. and continued on "
+            f"{end_date}, at 9:00 a.m.<sup>1</sup>"
+        )
+    else:
+        date_str = _format_long_date(start)
+        return (
+            f"A joint meeting of the Federal Open Market Committee and the Board of "
+            f"Governors of the Federal Reserve System was held in the offices of the "
+            f"Board of Governors on {date_str}, at 10:00 a.m.<sup>1</sup>"
+        )
+
+
+_BOLD_PATTERN = re.compile(r"\*\*([^*]+)\*\*")
+_ITALIC_PATTERN = re.compile(r"\*([^*]+)\*")
+
+# Whitespace around block-level tags and runs of whitespace inside text don't
+# affect layout, so they are stripped before the HTML reaches WeasyPrint's parser
+_BLOCK_TAG_WHITESPACE = re.compile(
+    r"(</?(?:html|head|meta|title|body|h[1-6]|div|p)\b[^>]*>)\s+(?=<)"
+)
+_WHITESPACE_RUN = re.compile(r"\s{2,}")
+
+_RAISE_TARGET_RANGE = "raise the target range for the federal funds rate"
+_LOWER_TARGET_RANGE = "lower the target range for the federal funds rate"
+
+
+def _action_description(rate_change_bps: int) -> str:
+    """Describe the policy action for a rate change, as used in the minutes."""
+    if rate_change_bps > 0:
+        return f"{_RAISE_TARGET_RANGE} by {rate_change_bps} basis points"
+    if rate_change_bps < 0:
+        return f"{_LOWER_TARGET_RANGE} by {-rate_change_bps} basis points"
+    return "maintain the target range for the federal funds rate"
+
+
+@lru_cache(maxsize=16)
+def _attendance_section(year: int) -> str:
+    """Build the attendance section; it depends only on the (static) roster for a year."""
+    groups = get_attendance_groups(year)
+
+    parts = [
+        """
+        <div class="attendance-section">
+            <h2>Attendance</h2>
+        """
+    ]
+
+    # Chair and Vice Chairs
+    if groups.chair:
+        parts.append(f"<p>{groups.chair.name}, Chair</p>\n")
+    if groups.vice_chair:
+        parts.append(f"<p>{groups.vice_chair.name}, Vice Chair</p>\n")
+    if groups.vice_chair_supervision:
+        parts.append(f"<p>{groups.vice_chair_supervision.name}, Vice Chair for Supervision</p>\n")
+
+    # Governors
+    if groups.governors:
+        gov_names = ", ".join(g.name for g in groups.governors)
+        parts.append(f"<p>{gov_names}, Governors</p>\n")
+
+    # NY Fed President
+    if groups.ny_president:
+        parts.append(
+            f"<p>{groups.ny_president.name}, President, Federal Reserve Bank of New York</p>\n"
+        )
+
+    # Voting Reserve Bank Presidents
+    if groups.voting_presidents:
+        parts.append("<p class='attendance-group-title'>Voting Reserve Bank Presidents:</p>\n")
+        parts.extend(
+            f"<p>{pres.name}, President, {pres.bank.removeprefix('Federal Reserve Bank of ')}</p>\n"
+            for pres in groups.voting_presidents
+        )
+
+    # Non-voting Reserve Bank Presidents (Alternate Members)
+    if groups.non_voting_presidents:
+        parts.append("<p class='attendance-group-title'>Alternate Members of the Committee:</p>\n")
+        # Show first 4
+        alt_names = ", ".join([p.name for p in groups.non_voting_presidents[:4]])
+        parts.append(f"<p>{alt_names}</p>\n")
+
+    parts.append(_ATTENDANCE_FOOTNOTE_HTML)
+
+    return "".join(parts)
+
+
+@lru_cache(maxsize=1)
+def _font_config() -> FontConfiguration:
+    """Get the font configuration shared by every render, so font lookups are reused."""
+    return FontConfiguration()
+
+
+@lru_cache(maxsize=1)
+def _fed_stylesheet() -> CSS:
+    """Get the parsed Fed stylesheet, shared by every render so it is parsed once."""
+    return CSS(string=FED_STYLE_CSS, font_config=_font_config())
+
+
+def _render_pdf(settings: Settings, result: MeetingResult, output_path: Path) -> Path:
+    """Render one result to PDF; module-level so process pool workers can pickle it."""
+    return PDFGenerator(settings).generate_pdf(result, output_path)
+
+
+def _render_all_formats(
+    settings: Settings, result: MeetingResult, output_dir: Path
+) -> dict[str, Path]:
+    """Render one result in every format; module-level so pool workers can pickle it."""
+    return PDFGenerator(settings).generate_all_formats(result, output_dir)
+
+
 class PDFGenerator:
     """Generates PDF meeting minutes in official Fed format."""
 
@@ -228,9 +393,6 @@ class PDFGenerator:
         decision = result.decision
         year = meeting.meeting_date.year
 
-        # Get voting members for this year
-        voting_members = get_voting_members(year)
-
         # Build opening paragraph
         opening = self._build_opening_paragraph(meeting)
 
@@ -301,7 +463,7 @@ class PDFGenerator:
         <p class="disclaimer-title">AI-GENERATED SIMULATION NOTICE</p>
         <p>
             This document was generated by an AI simulation system (Fed Decision Board)
-            using {result.model_used} and does not represent actual Federal Reserve
+            using {escape(result.model_used)} and does not represent actual Federal Reserve
             decisions, policy, or official communications. The content is produced for
             educational, research, and analytical purposes only. Any resemblance to
             actual FOMC deliberations is simulated based on publicly available information
@@ -312,26 +474,11 @@ class PDFGenerator:
 </body>
 </html>
 """
-        return html
+        return _WHITESPACE_RUN.sub(" ", _BLOCK_TAG_WHITESPACE.sub(r"\1", html))
 
     def _build_opening_paragraph(self, meeting) -> str:
         """Build the official opening paragraph."""
-        if meeting.meeting_end_date:
-            start_date = meeting.meeting_date.strftime("%A, %B %d, %Y")
-            end_date = meeting.meeting_end_date.strftime("%A, %B %d, %Y")
-            return (
-                f"A joint meeting of the Federal Open Market Committee and the Board of "
-                f"Governors of the Federal Reserve System was held in the offices of the "
-                f"Board of Governors on {start_date}, at 10:00 a.m. and continued on "
-                f"{end_date}, at 9:00 a.m.<sup>1</sup>"
-            )
-        else:
-            date_str = meeting.meeting_date.strftime("%A, %B %d, %Y")
-            return (
-                f"A joint meeting of the Federal Open Market Committee and the Board of "
-                f"Governors of the Federal Reserve System was held in the offices of the "
-                f"Board of Governors on {date_str}, at 10:00 a.m.<sup>1</sup>"
-            )
+        return _opening_paragraph(meeting.meeting_date, meeting.meeting_end_date)
 
     def _build_financial_markets_section(self, result: MeetingResult) -> str:
         """Build the financial markets and open market operations section."""
@@ -400,9 +547,8 @@ class PDFGenerator:
         )
 
         if outlook_text:
-            # Format the AI-generated content
-            formatted = self._format_paragraphs(outlook_text)
-            paragraphs.append(formatted)
+            # Format the AI-generated content; it is model output, so always escape it
+            paragraphs.append(self._format_paragraphs(outlook_text))
 
         paragraphs.append(
             "<p>The unemployment rate remained at low levels by historical standards. "
@@ -425,62 +571,25 @@ class PDFGenerator:
 
     def _build_staff_financial_section(self, result: MeetingResult) -> str:
         """Build the staff review of financial situation section."""
-        return """
-        <p>Over the intermeeting period, nominal Treasury yields showed modest movements
-        as market participants assessed incoming economic data and implications for
-        monetary policy. Changes in nominal yields reflected movements in both real
-        yields and inflation compensation.</p>
-
-        <p>In domestic credit markets, conditions remained generally supportive for
-        businesses and households. Financing conditions were somewhat restrictive for
-        some borrowers, particularly in sectors sensitive to interest rates. Large
-        businesses continued to access credit markets at a solid pace.</p>
-
-        <p>Credit performance remained stable in most markets. Delinquency rates for
-        consumer loans remained elevated in some categories but showed signs of
-        stabilization. Commercial real estate credit conditions continued to warrant
-        close monitoring given the ongoing adjustments in that sector.</p>
-
-        <p>Bank lending standards remained somewhat tight across most loan categories,
-        while loan demand showed mixed signals. Market-based financing remained available
-        for investment-grade borrowers at favorable terms.</p>
-        """
+        return _STAFF_FINANCIAL_HTML
 
     def _build_staff_outlook_section(self, result: MeetingResult) -> str:
         """Build the staff economic outlook section."""
-        return """
-        <p>The staff projection for the U.S. economy anticipated continued moderate
-        growth in real GDP. The projection incorporated the assumption that financial
-        conditions would remain generally supportive of economic expansion while
-        monetary policy worked to bring inflation back to the Committee's 2 percent
-        objective.</p>
-
-        <p>The staff's inflation forecast anticipated a gradual return toward the
-        Committee's 2 percent longer-run objective, although the path was expected
-        to be uneven. Core inflation was projected to moderate as supply and demand
-        conditions continued to come into better balance.</p>
-
-        <p>The staff continued to judge that uncertainty around the baseline projection
-        remained elevated. Risks around the forecast for real activity were seen as
-        roughly balanced. Risks around the inflation forecast remained tilted to the
-        upside, given the possibility that inflation could prove more persistent than
-        expected.</p>
-        """
+        return _STAFF_OUTLOOK_HTML
 
     def _build_participants_views_section(self, result: MeetingResult) -> str:
         """Build the participants' views section in impersonal Fed style."""
         decision = result.decision
 
-        # Analyze vote preferences to determine sentiment distribution
-        hawk_count = sum(
-            1 for v in result.vote_preferences
-            if v.preferred_rate_change > 0 or "inflation" in v.reasoning.lower()
-        )
-        dove_count = sum(
-            1 for v in result.vote_preferences
-            if v.preferred_rate_change < 0 or "employment" in v.reasoning.lower()
-        )
-        total = len(result.vote_preferences) if result.vote_preferences else 12
+        # Analyze vote preferences to determine sentiment distribution, in one
+        # pass that lowercases each reasoning once
+        hawk_count = dove_count = 0
+        for v in result.vote_preferences:
+            reasoning = v.reasoning.lower()
+            if v.preferred_rate_change > 0 or "inflation" in reasoning:
+                hawk_count += 1
+            if v.preferred_rate_change < 0 or "employment" in reasoning:
+                dove_count += 1
 
         paragraphs = []
 
@@ -594,16 +703,7 @@ class PDFGenerator:
         """Build the committee policy actions section in Fed style."""
         decision = result.decision
 
-        # Determine the action description
-        if decision.rate_change_bps > 0:
-            action_desc = f"raise the target range for the federal funds rate by {decision.rate_change_bps} basis points"
-            vote_count = result.vote_count_for
-        elif decision.rate_change_bps < 0:
-            action_desc = f"lower the target range for the federal funds rate by {abs(decision.rate_change_bps)} basis points"
-            vote_count = result.vote_count_for
-        else:
-            action_desc = "maintain the target range for the federal funds rate"
-            vote_count = result.vote_count_for
+        action_desc = _action_description(decision.rate_change_bps)
 
         paragraphs = []
 
@@ -652,7 +752,8 @@ class PDFGenerator:
         dissents = []
         for analysis in result.dissent_analyses:
             dissents.append(
-                f"{analysis.dissenter_name}, who preferred {analysis.dissenter_preference}"
+                f"{escape(analysis.dissenter_name)}, who preferred "
+                f"{escape(analysis.dissenter_preference)}"
             )
 
         if len(dissents) == 1:
@@ -666,114 +767,41 @@ class PDFGenerator:
         """Build the voting section with member names."""
         decision = result.decision
 
-        # Get voters for and against
-        for_voters = [v.member_name for v in result.votes if v.vote_for_decision]
-        against_voters = [v for v in result.votes if not v.vote_for_decision]
-
-        # Determine action text
-        if decision.rate_change_bps > 0:
-            action = f"raise the target range for the federal funds rate by {decision.rate_change_bps} basis points to {decision.rate_range_str}"
-        elif decision.rate_change_bps < 0:
-            action = f"lower the target range for the federal funds rate by {abs(decision.rate_change_bps)} basis points to {decision.rate_range_str}"
-        else:
-            action = f"maintain the target range for the federal funds rate at {decision.rate_range_str}"
+        # Get voters for and against in a single pass over the votes
+        for_voters = []
+        against_names = []
+        for v in result.votes:
+            if v.vote_for_decision:
+                for_voters.append(escape(v.member_name))
+                continue
+            if v.preferred_rate > decision.new_rate_upper:
+                reason = "who preferred to raise rates further"
+            elif v.preferred_rate < decision.new_rate_lower:
+                reason = "who preferred a larger rate reduction"
+            else:
+                reason = "who preferred a different policy action"
+            against_names.append(f"{escape(v.member_name)}, {reason}")
 
+        parts = []
         if for_voters:
-            html = f"<p><strong>Voting for this action:</strong> {'; '.join(for_voters)}.</p>\n"
+            parts.append(
+                f"<p><strong>Voting for this action:</strong> {'; '.join(for_voters)}.</p>\n"
+            )
         else:
-            html = "<p><strong>Voting for this action:</strong> None.</p>\n"
-
-        if against_voters:
-            against_names = []
-            for v in against_voters:
-                reason = ""
-                if v.preferred_rate > decision.new_rate_upper:
-                    reason = f"who preferred to raise rates further"
-                elif v.preferred_rate < decision.new_rate_lower:
-                    reason = f"who preferred a larger rate reduction"
-                else:
-                    reason = f"who preferred a different policy action"
-                against_names.append(f"{v.member_name}, {reason}")
-
-            html += f"<p><strong>Voting against this action:</strong> {'; '.join(against_names)}.</p>\n"
+            parts.append("<p><strong>Voting for this action:</strong> None.</p>\n")
+
+        if against_names:
+            parts.append(
+                f"<p><strong>Voting against this action:</strong> {'; '.join(against_names)}.</p>\n"
+            )
         else:
-            html += "<p><strong>Voting against this action:</strong> None.</p>\n"
+            parts.append("<p><strong>Voting against this action:</strong> None.</p>\n")
 
-        return html
+        return "".join(parts)
 
     def _build_attendance_section(self, result: MeetingResult, year: int) -> str:
         """Build the attendance section listing all participants."""
-        # Separate members by role
-        chair = None
-        vice_chair = None
-        vice_chair_supervision = None
-        governors = []
-        ny_president = None
-        voting_presidents = []
-        non_voting_presidents = []
-
-        for member in FOMC_MEMBERS:
-            if member.role == Role.CHAIR:
-                chair = member
-            elif member.role == Role.VICE_CHAIR:
-                vice_chair = member
-            elif member.role == Role.VICE_CHAIR_SUPERVISION:
-                vice_chair_supervision = member
-            elif member.role == Role.GOVERNOR:
-                governors.append(member)
-            elif member.role == Role.PRESIDENT:
-                if "New York" in member.bank:
-                    ny_president = member
-                elif member.is_voting_in_year(year):
-                    voting_presidents.append(member)
-                else:
-                    non_voting_presidents.append(member)
-
-        html = """
-        <div class="attendance-section">
-            <h2>Attendance</h2>
-        """
-
-        # Chair and Vice Chairs
-        if chair:
-            html += f"<p>{chair.name}, Chair</p>\n"
-        if vice_chair:
-            html += f"<p>{vice_chair.name}, Vice Chair</p>\n"
-        if vice_chair_supervision:
-            html += f"<p>{vice_chair_supervision.name}, Vice Chair for Supervision</p>\n"
-
-        # Governors
-        if governors:
-            gov_names = ", ".join([g.name for g in governors])
-            html += f"<p>{gov_names}, Governors</p>\n"
-
-        # NY Fed President
-        if ny_president:
-            html += f"<p>{ny_president.name}, President, Federal Reserve Bank of New York</p>\n"
-
-        # Voting Reserve Bank Presidents
-        if voting_presidents:
-            html += "<p class='attendance-group-title'>Voting Reserve Bank Presidents:</p>\n"
-            for pres in voting_presidents:
-                bank_name = pres.bank.replace("Federal Reserve Bank of ", "")
-                html += f"<p>{pres.name}, President, {bank_name}</p>\n"
-
-        # Non-voting Reserve Bank Presidents (Alternate Members)
-        if non_voting_presidents:
-            html += "<p class='attendance-group-title'>Alternate Members of the Committee:</p>\n"
-            alt_names = ", ".join([p.name for p in non_voting_presidents[:4]])  # Show first 4
-            html += f"<p>{alt_names}</p>\n"
-
-        html += """
-            <div class="footnote">
-                <p><sup>1</sup> This AI simulation represents a hypothetical FOMC meeting
-                based on the economic conditions and member characteristics as of the
-                simulation date. Attendance reflects the current FOMC composition.</p>
-            </div>
-        </div>
-        """
-
-        return html
+        return _attendance_section(year)
 
     def _get_action_text(self, decision) -> str:
         """Get action text for the decision."""
@@ -793,10 +821,11 @@ class PDFGenerator:
         for p in paragraphs:
             p = p.strip()
             if p:
+                p = escape(p, quote=False)
                 # Handle markdown-style bold
-                p = re.sub(r'\*\*([^*]+)\*\*', r'<strong>\1</strong>', p)
+                p = _BOLD_PATTERN.sub(r'<strong>\1</strong>', p)
                 # Handle markdown-style italic
-                p = re.sub(r'\*([^*]+)\*', r'<em>\1</em>', p)
+                p = _ITALIC_PATTERN.sub(r'<em>\1</em>', p)
                 html_paragraphs.append(f"<p>{p}</p>")
         return "\n".join(html_paragraphs)
 
@@ -821,15 +850,51 @@ class PDFGenerator:
             output_path = output_dir / f"{result.meeting.month_str}.pdf"
 
         html_content = self.generate_html(result)
-        css = CSS(string=FED_STYLE_CSS)
 
-        HTML(string=html_content).write_pdf(
-            output_path,
-            stylesheets=[css],
+        # Render to memory and write once, so a failed render can't leave a
+        # truncated PDF behind
+        pdf_bytes = HTML(string=html_content).write_pdf(
+            stylesheets=[_fed_stylesheet()],
+            font_config=_font_config(),
         )
+        output_path.write_bytes(pdf_bytes)
 
         return output_path
 
+    def generate_many(
+        self,
+        results: list[MeetingResult],
+        output_dir: Path | None = None,
+        max_workers: int | None = None,
+    ) -> list[Path]:
+        """
+        Generate PDF minutes for many meetings in parallel.
+
+        WeasyPrint renders on a single core, so independent meetings are
+        spread over a process pool.
+
+        Args:
+            results: The meeting results
+            output_dir: Output directory (defaults to settings minutes_dir)
+            max_workers: Number of worker processes (defaults to the CPU count)
+
+        Returns:
+            Paths to the generated PDFs, in the order of results
+        """
+        if output_dir is None:
+            output_dir = self.settings.minutes_dir
+        output_dir.mkdir(parents=True, exist_ok=True)
+        paths = [output_dir / f"{result.meeting.month_str}.pdf" for result in results]
+
+        if len(results) <= 1 or max_workers == 1:
+            return [self.generate_pdf(r, p) for r, p in zip(results, paths, strict=True)]
+
+        workers = min(max_workers or os.cpu_count() or 1, len(results))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(_render_pdf, [self.settings] * len(results), results, paths)
+            )
+
     def generate_all_formats(
         self,
         result: MeetingResult,
@@ -861,3 +926,38 @@ class PDFGenerator:
         outputs["pdf"] = pdf_path
 
         return outputs
+
+    def generate_all_formats_many(
+        self,
+        results: list[MeetingResult],
+        output_dir: Path | None = None,
+        max_workers: int | None = None,
+    ) -> list[dict[str, Path]]:
+        """
+        Generate minutes in all formats for many meetings in parallel.
+
+        Args:
+            results: The meeting results
+            output_dir: Output directory (defaults to settings minutes_dir)
+            max_workers: Number of worker processes (defaults to the CPU count)
+
+        Returns:
+            Dicts mapping format to output path, in the order of results
+        """
+        if output_dir is None:
+            output_dir = self.settings.minutes_dir
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        if len(results) <= 1 or max_workers == 1:
+            return [self.generate_all_formats(r, output_dir) for r in results]
+
+        workers = min(max_workers or os.cpu_count() or 1, len(results))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(
+                    _render_all_formats,
+                    [self.settings] * len(results),
+                    results,
+                    [output_dir] * len(results),
+                )
+            )
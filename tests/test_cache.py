@@ -0,0 +1,115 @@
+"""Tests for the FRED response cache."""
+
+from pathlib import Path
+
+from fed_board.data.cache import FREDCache
+
+OBSERVATIONS = [
+    {"date": "2025-01-01", "value": "4.1"},
+    {"date": "2024-12-01", "value": "4.2"},
+]
+
+
+class TestFREDCache:
+    """Tests for FREDCache."""
+
+    def test_set_and_get(self, tmp_path: Path) -> None:
+        """Test that cached data round-trips through the cache."""
+        cache = FREDCache(tmp_path)
+        cache.set("UNRATE", OBSERVATIONS)
+        assert cache.get("UNRATE") == OBSERVATIONS
+
+    def test_missing_series(self, tmp_path: Path) -> None:
+        """Test that an uncached series is a miss."""
+        cache = FREDCache(tmp_path)
+        assert cache.get("UNRATE") is None
+
+    def test_expired_entry(self, tmp_path: Path) -> None:
+        """Test that expired entries are dropped."""
+        cache = FREDCache(tmp_path, ttl_monthly=-1)
+        cache.set("UNRATE", OBSERVATIONS)
+        assert cache.get("UNRATE") is None
+        assert cache.get_stats()["total_entries"] == 0
+
+    def test_corrupted_file(self, tmp_path: Path) -> None:
+        """Test that a corrupted cache file is treated as a miss and removed."""
+        cache = FREDCache(tmp_path)
+        cache.set("UNRATE", OBSERVATIONS)
+        (tmp_path / "unrate.json").write_text("{not json")
+        assert cache.get("UNRATE") is None
+        assert cache.get_stats()["total_entries"] == 0
+
+    def test_repeated_get_reuses_parsed_entry(self, tmp_path: Path) -> None:
+        """Test that unchanged files are served from the in-memory layer."""
+        cache = FREDCache(tmp_path)
+        cache.set("UNRATE", OBSERVATIONS)
+        assert cache.get("UNRATE") is cache.get("UNRATE")
+
+    def test_set_replaces_remembered_entry(self, tmp_path: Path) -> None:
+        """Test that overwriting a series is visible on the next get."""
+        cache = FREDCache(tmp_path)
+        cache.set("UNRATE", OBSERVATIONS)
+        cache.get("UNRATE")
+        cache.set("UNRATE", OBSERVATIONS[:1])
+        assert cache.get("UNRATE") == OBSERVATIONS[:1]
+
+    def test_invalidate_and_clear(self, tmp_path: Path) -> None:
+        """Test invalidating one series and clearing the cache."""
+        cache = FREDCache(tmp_path)
+        cache.set("UNRATE", OBSERVATIONS)
+        cache.set("DGS10", OBSERVATIONS, frequency="daily")
+        assert cache.invalidate("UNRATE") is True
+        assert cache.invalidate("UNRATE") is False
+        assert cache.get("UNRATE") is None
+        assert cache.clear() == 1
+        assert cache.get("DGS10") is None
+
+    def test_stats(self, tmp_path: Path) -> None:
+        """Test cache statistics."""
+        cache = FREDCache(tmp_path)
+        cache.set("UNRATE", OBSERVATIONS)
+        cache.set("DGS10", OBSERVATIONS, frequency="daily")
+        stats = cache.get_stats()
+        assert stats["total_entries"] == 2
+        assert stats["valid_entries"] == 2
+        assert stats["expired_entries"] == 0
+        assert stats["total_size_bytes"] > 0
+
+    def test_stats_include_entries_from_other_instances(self, tmp_path: Path) -> None:
+        """Test that stats count entries written by another cache instance."""
+        cache = FREDCache(tmp_path)
+        cache.set("UNRATE", OBSERVATIONS)
+        FREDCache(tmp_path, ttl_daily=-1).set("DGS10", OBSERVATIONS, frequency="daily")
+        stats = cache.get_stats()
+        assert stats["total_entries"] == 2
+        assert stats["valid_entries"] == 1
+        assert stats["expired_entries"] == 1
+
+    def test_index_is_written_by_stats_not_set(self, tmp_path: Path) -> None:
+        """Test that set() leaves the expiry index to be persisted by get_stats()."""
+        cache = FREDCache(tmp_path)
+        cache.set("UNRATE", OBSERVATIONS)
+        index_path = tmp_path / FREDCache.INDEX_FILENAME
+        assert not index_path.exists()
+        cache.get_stats()
+        assert index_path.exists()
+        assert FREDCache(tmp_path).get_stats()["valid_entries"] == 1
+
+    def test_ttl_follows_release_frequency(self, tmp_path: Path) -> None:
+        """Test that each frequency gets its own TTL."""
+        cache = FREDCache(tmp_path, ttl_monthly=1, ttl_daily=2, ttl_weekly=3, ttl_quarterly=4)
+        assert cache._get_ttl("monthly") == 1
+        assert cache._get_ttl("daily") == 2
+        assert cache._get_ttl("weekly") == 3
+        assert cache._get_ttl("quarterly") == 4
+        assert cache._get_ttl("annual") == 1
+
+    def test_snapshot_round_trip_and_clear(self, tmp_path: Path) -> None:
+        """Test that snapshots are stored alongside series and removed by clear()."""
+        cache = FREDCache(tmp_path)
+        cache.set_snapshot("current_indicators", {"fed_funds_rate": 4.33}, ttl_seconds=60)
+        assert FREDCache(tmp_path).get_snapshot("current_indicators") == {"fed_funds_rate": 4.33}
+        cache.set_snapshot("stale", {"fed_funds_rate": 4.33}, ttl_seconds=-1)
+        assert cache.get_snapshot("stale") is None
+        cache.clear()
+        assert cache.get_snapshot("current_indicators") is None
@@ -0,0 +1,60 @@
+"""Tests for the dot plot generator."""
+
+from pathlib import Path
+
+import pytest
+
+from fed_board.config import Settings
+from fed_board.models.meeting import RateProjection
+from fed_board.outputs.dotplot import DotPlotGenerator
+
+PROJECTIONS = [
+    RateProjection(
+        member_name=f"Member {i}",
+        year_end_2025=4.0 + i * 0.25,
+        year_end_2026=3.5 + i * 0.25,
+        year_end_2027=3.0 + i * 0.25,
+        longer_run=3.0,
+    )
+    for i in range(3)
+]
+
+
+@pytest.fixture
+def generator(tmp_path: Path) -> DotPlotGenerator:
+    """Create a generator writing into a temporary data directory."""
+    return DotPlotGenerator(Settings(anthropic_api_key="x", fred_api_key="y", data_dir=tmp_path))
+
+
+class TestDotPlotGenerator:
+    """Tests for DotPlotGenerator."""
+
+    def test_summary_stats(self, generator: DotPlotGenerator) -> None:
+        """Test per-period statistics across projections."""
+        stats = generator.generate_summary_stats(PROJECTIONS)
+        assert list(stats) == ["2025", "2026", "2027", "longer_run"]
+        assert stats["2025"] == {
+            "median": 4.25,
+            "mean": 4.25,
+            "min": 4.0,
+            "max": 4.5,
+            "range": 0.5,
+            "count": 3,
+        }
+        assert stats["longer_run"]["range"] == 0.0
+
+    def test_summary_stats_empty(self, generator: DotPlotGenerator) -> None:
+        """Test that no projections produce no statistics."""
+        assert generator.generate_summary_stats([]) == {}
+
+    def test_generate_dotplot(self, generator: DotPlotGenerator, tmp_path: Path) -> None:
+        """Test that a PNG is written to the default location."""
+        path = generator.generate_dotplot(PROJECTIONS, 2025)
+        assert path == tmp_path / "dotplots" / "2025.png"
+        assert path.read_bytes().startswith(b"\x89PNG")
+
+    def test_generate_dotplot_empty(self, generator: DotPlotGenerator, tmp_path: Path) -> None:
+        """Test that an empty projection list is rejected before rendering."""
+        with pytest.raises(ValueError):
+            generator.generate_dotplot([], 2025)
+        assert not (tmp_path / "dotplots").exists()
@@ -0,0 +1,213 @@
+"""Tests for the FRED API client."""
+
+import asyncio
+from datetime import date
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+
+from fed_board.config import Settings
+from fed_board.data.fred import (
+    FREDClient,
+    _indicator_with_trend,
+    _latest_value,
+    _mom_change,
+    _yoy_change,
+    _yoy_with_trend,
+    parse_observations,
+)
+from fed_board.data.indicators import FRED_SERIES
+
+# 20 monthly observations, newest first: 120, 119, ..., 101
+OBSERVATIONS = [
+    {"date": f"{2025 - (i + 11) // 12}-{12 - (i + 11) % 12:02d}-01", "value": str(120 - i)}
+    for i in range(20)
+]
+
+
+class TestObservationHelpers:
+    """Tests for deriving metrics from observations."""
+
+    def test_parse_observations(self) -> None:
+        """Test parsing values and dates, with '.' as a missing value."""
+        values, dates = parse_observations(
+            [{"date": "2025-02-01", "value": "4.5"}, {"date": "2025-01-01", "value": "."}]
+        )
+        assert values == [4.5, None]
+        assert dates == [date(2025, 2, 1), date(2025, 1, 1)]
+
+    def test_latest_value(self) -> None:
+        """Test reading the newest value."""
+        assert _latest_value(OBSERVATIONS) == 120.0
+        assert _latest_value([]) is None
+        assert _latest_value([{"date": "2025-01-01", "value": "."}]) is None
+
+    def test_mom_change(self) -> None:
+        """Test period-over-period change."""
+        assert _mom_change(OBSERVATIONS) == pytest.approx((120 - 119) / 119 * 100)
+        assert _mom_change(OBSERVATIONS[:1]) is None
+
+    def test_yoy_change(self) -> None:
+        """Test year-over-year change."""
+        assert _yoy_change(OBSERVATIONS) == pytest.approx((120 - 108) / 108 * 100)
+        assert _yoy_change(OBSERVATIONS[:11]) is None
+
+    def test_yoy_with_trend(self) -> None:
+        """Test YoY trend uses the last three periods."""
+        trend = _yoy_with_trend(OBSERVATIONS)
+        assert trend.current == pytest.approx((120 - 108) / 108 * 100)
+        assert trend.previous == pytest.approx((119 - 107) / 107 * 100)
+
+    def test_indicator_with_trend(self) -> None:
+        """Test trend over raw values."""
+        trend = _indicator_with_trend(OBSERVATIONS, 3)
+        assert trend.current == 120.0
+        assert trend.previous == 119.0
+
+    def test_trends_skip_malformed_observations(self) -> None:
+        """Test that one malformed observation is skipped rather than dropping the trend."""
+        observations = [
+            OBSERVATIONS[0],
+            {"date": "2025-11-01", "value": "n/a"},
+            {"date": "not-a-date", "value": "118"},
+            *OBSERVATIONS[3:],
+        ]
+        trend = _indicator_with_trend(observations, 4)
+        assert trend.current == 120.0
+        assert trend.previous == 117.0
+        assert trend.data_date == date.fromisoformat(OBSERVATIONS[0]["date"])
+        yoy = _yoy_with_trend(observations)
+        assert yoy.current == pytest.approx((120 - 108) / 108 * 100)
+        assert yoy.previous is None
+
+
+class TestFREDClient:
+    """Tests for FREDClient."""
+
+    @respx.mock
+    async def test_economic_indicators_fetch_each_series_once(self, tmp_path: Path) -> None:
+        """Test that a snapshot requests each series a single time."""
+        route = respx.get(f"{FREDClient.BASE_URL}/series/observations").mock(
+            return_value=httpx.Response(200, json={"observations": OBSERVATIONS})
+        )
+        settings = Settings(anthropic_api_key="x", fred_api_key="y", data_dir=tmp_path)
+
+        async with FREDClient(settings) as client:
+            indicators = await client.get_economic_indicators(use_cache=False)
+
+        requested = [call.request.url.params["series_id"] for call in route.calls]
+        assert len(requested) == len(set(requested))
+        assert FRED_SERIES["industrial_production"] in requested
+        assert indicators.inflation.cpi_yoy == pytest.approx((120 - 108) / 108 * 100)
+
+    @respx.mock
+    async def test_concurrent_identical_queries_share_one_request(self, tmp_path: Path) -> None:
+        """Test that concurrent callers for the same query are coalesced."""
+        route = respx.get(f"{FREDClient.BASE_URL}/series/observations").mock(
+            return_value=httpx.Response(200, json={"observations": OBSERVATIONS})
+        )
+        settings = Settings(anthropic_api_key="x", fred_api_key="y", data_dir=tmp_path)
+
+        async with FREDClient(settings) as client:
+            first, second = await asyncio.gather(
+                client.get_series("UNRATE", limit=20, use_cache=False),
+                client.get_series("UNRATE", limit=20, use_cache=False),
+            )
+
+        assert route.call_count == 1
+        assert first == second == OBSERVATIONS
+
+    @respx.mock
+    async def test_cache_is_keyed_by_query(self, tmp_path: Path) -> None:
+        """Test that a cached query doesn't answer a differently-shaped one."""
+        route = respx.get(f"{FREDClient.BASE_URL}/series/observations").mock(
+            return_value=httpx.Response(200, json={"observations": OBSERVATIONS})
+        )
+        settings = Settings(anthropic_api_key="x", fred_api_key="y", data_dir=tmp_path)
+
+        async with FREDClient(settings) as client:
+            await client.get_series("DFEDTARU", limit=20)
+            await client.get_series("DFEDTARU", limit=20)
+            await client.get_series("DFEDTARU", limit=50, sort_order="asc")
+
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_recent_window_cache_survives_a_new_day(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the rolling recent window is cached under a date-independent key."""
+        route = respx.get(f"{FREDClient.BASE_URL}/series/observations").mock(
+            return_value=httpx.Response(200, json={"observations": OBSERVATIONS})
+        )
+        settings = Settings(anthropic_api_key="x", fred_api_key="y", data_dir=tmp_path)
+
+        class Tomorrow(date):
+            @classmethod
+            def today(cls) -> "Tomorrow":
+                return cls.fromordinal(date.today().toordinal() + 1)
+
+        async with FREDClient(settings) as client:
+            await client.get_latest_value("UNRATE")
+            monkeypatch.setattr("fed_board.data.fred.date", Tomorrow)
+            await client.get_latest_value("UNRATE")
+
+        assert route.call_count == 1
+        assert len(list(settings.fred_cache_dir.glob("*.json"))) == 1
+
+    @respx.mock
+    def test_client_survives_successive_event_loops(self, tmp_path: Path) -> None:
+        """Test that a client left open by one asyncio.run() isn't reused by the next."""
+        route = respx.get(f"{FREDClient.BASE_URL}/series/observations").mock(
+            return_value=httpx.Response(200, json={"observations": OBSERVATIONS})
+        )
+        settings = Settings(anthropic_api_key="x", fred_api_key="y", data_dir=tmp_path)
+        client = FREDClient(settings)
+
+        async def fetch_and_close() -> None:
+            async with client:
+                await client.get_series("UNRATE", use_cache=False)
+
+        asyncio.run(client.get_series("UNRATE", use_cache=False))
+        asyncio.run(fetch_and_close())
+
+        assert route.call_count == 2
+        assert client._client is None
+
+    @respx.mock
+    async def test_transient_errors_are_retried(self, tmp_path: Path) -> None:
+        """Test that a 503 is retried before giving up on the request."""
+        route = respx.get(f"{FREDClient.BASE_URL}/series/observations").mock(
+            side_effect=[
+                httpx.Response(503, headers={"Retry-After": "0"}),
+                httpx.Response(200, json={"observations": OBSERVATIONS}),
+            ]
+        )
+        settings = Settings(anthropic_api_key="x", fred_api_key="y", data_dir=tmp_path)
+
+        async with FREDClient(settings) as client:
+            observations = await client.get_series("UNRATE", use_cache=False)
+
+        assert route.call_count == 2
+        assert observations == OBSERVATIONS
+
+    @respx.mock
+    async def test_failed_series_leaves_its_indicators_empty(self, tmp_path: Path) -> None:
+        """Test that one failing series doesn't break the rest of the snapshot."""
+        respx.get(
+            f"{FREDClient.BASE_URL}/series/observations",
+            params={"series_id": FRED_SERIES["unemployment_rate"]},
+        ).mock(return_value=httpx.Response(400, json={"error_message": "Bad Request"}))
+        respx.get(f"{FREDClient.BASE_URL}/series/observations").mock(
+            return_value=httpx.Response(200, json={"observations": OBSERVATIONS})
+        )
+        settings = Settings(anthropic_api_key="x", fred_api_key="y", data_dir=tmp_path)
+
+        async with FREDClient(settings) as client:
+            indicators = await client.get_economic_indicators(use_cache=False)
+
+        assert indicators.employment.unemployment_rate is None
+        assert indicators.trends["unemployment_rate"].current is None
+        assert indicators.employment.nonfarm_payrolls == 120.0
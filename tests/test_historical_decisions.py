@@ -0,0 +1,66 @@
+"""Tests for fetching actual Fed decisions."""
+
+from datetime import date, timedelta
+from pathlib import Path
+
+import httpx
+import respx
+
+from fed_board.config import Settings
+from fed_board.data.fred import FREDClient
+from fed_board.data.historical_decisions import (
+    get_actual_decision,
+    get_actual_decisions_for_year,
+)
+
+CUT_DATE = date(2024, 9, 18)
+
+
+def target_rate_response(request: httpx.Request) -> httpx.Response:
+    """Serve daily target rates with a 50 bps cut on CUT_DATE."""
+    params = request.url.params
+    offset = 0.0 if params["series_id"] == "DFEDTARU" else -0.25
+    day = date.fromisoformat(params["observation_start"])
+    end = date.fromisoformat(params["observation_end"])
+    observations = []
+    while day <= end:
+        rate = (5.5 if day < CUT_DATE else 5.0) + offset
+        observations.append({"date": day.isoformat(), "value": f"{rate:.2f}"})
+        day += timedelta(days=1)
+    return httpx.Response(200, json={"observations": observations})
+
+
+class TestActualDecisions:
+    """Tests for actual decision lookups."""
+
+    @respx.mock
+    async def test_get_actual_decision(self, tmp_path: Path) -> None:
+        """Test detecting a cut at a single meeting."""
+        respx.get(f"{FREDClient.BASE_URL}/series/observations").mock(
+            side_effect=target_rate_response
+        )
+        settings = Settings(anthropic_api_key="x", fred_api_key="y", data_dir=tmp_path)
+
+        async with FREDClient(settings) as client:
+            decision = await get_actual_decision(client, CUT_DATE)
+
+        assert decision is not None
+        assert decision.decision_type == "CUT"
+        assert decision.change_bps == -50
+        assert decision.rate_range_str == "4.75%-5.00%"
+
+    @respx.mock
+    async def test_year_fetches_each_series_once(self, tmp_path: Path) -> None:
+        """Test that a year's decisions share one fetch per target series."""
+        route = respx.get(f"{FREDClient.BASE_URL}/series/observations").mock(
+            side_effect=target_rate_response
+        )
+        settings = Settings(anthropic_api_key="x", fred_api_key="y", data_dir=tmp_path)
+
+        async with FREDClient(settings) as client:
+            decisions = await get_actual_decisions_for_year(client, 2024)
+
+        assert route.call_count == 2
+        assert len(decisions) == 8
+        assert [d.decision_type for d in decisions].count("CUT") == 1
+        assert next(d for d in decisions if d.decision_type == "CUT").meeting_date == CUT_DATE
@@ -3,6 +3,7 @@
 from datetime import date
 
 import pytest
+from pydantic import ValidationError
 
 from fed_board.data.indicators import (
     FRED_FREQUENCIES,
@@ -122,3 +123,16 @@ class TestEconomicIndicators:
         assert "Economic Briefing" in briefing
         assert "Inflation" in briefing
         assert "January 15, 2024" in briefing
+
+    def test_briefing_follows_copies(self) -> None:
+        """Test that a cached briefing is neither mutable nor carried into an updated copy."""
+        indicators = EconomicIndicators(
+            as_of_date=date(2024, 1, 15),
+            markets=MarketIndicators(fed_funds_rate=5.33),
+        )
+        assert "January 15, 2024" in indicators.to_briefing()
+        with pytest.raises(ValidationError):
+            indicators.as_of_date = date(2024, 2, 15)
+        copied = indicators.model_copy(update={"as_of_date": date(2024, 2, 15)})
+        assert "February 15, 2024" in copied.to_briefing()
+        assert "January 15, 2024" in indicators.to_briefing()
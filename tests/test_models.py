@@ -3,6 +3,7 @@
 from datetime import date
 
 import pytest
+from pydantic import ValidationError
 
 from fed_board.models.meeting import Decision, Meeting, MeetingResult, RateDecision, Vote
 from fed_board.models.member import (
@@ -14,69 +15,74 @@ from fed_board.models.member import (
 )
 
 
+@pytest.fixture(scope="module")
+def governor() -> FOMCMember:
+    """Create a Board Governor, shared by the module since members are frozen."""
+    return FOMCMember(
+        name="Test Governor",
+        short_name="test",
+        role=Role.GOVERNOR,
+        bank="Board of Governors",
+        stance=Stance.NEUTRAL,
+        priorities=["price stability", "employment"],
+        communication_style=CommunicationStyle.MEASURED,
+    )
+
+
+@pytest.fixture(scope="module")
+def president() -> FOMCMember:
+    """Create a Reserve Bank President who votes in 2024 and 2027."""
+    return FOMCMember(
+        name="Test President",
+        short_name="testp",
+        role=Role.PRESIDENT,
+        bank="Federal Reserve Bank of Test",
+        stance=Stance.HAWK,
+        priorities=["inflation"],
+        communication_style=CommunicationStyle.DIRECT,
+        voting_years=[2024, 2027],
+    )
+
+
 class TestFOMCMember:
     """Tests for FOMCMember model."""
 
-    def test_create_governor(self) -> None:
+    def test_create_governor(self, governor: FOMCMember) -> None:
         """Test creating a Board Governor."""
-        member = FOMCMember(
-            name="Test Governor",
-            short_name="test",
-            role=Role.GOVERNOR,
-            bank="Board of Governors",
-            stance=Stance.NEUTRAL,
-            priorities=["price stability", "employment"],
-            communication_style=CommunicationStyle.MEASURED,
-        )
-        assert member.name == "Test Governor"
-        assert member.is_governor is True
-        assert member.is_reserve_bank_president is False
+        assert governor.name == "Test Governor"
+        assert governor.is_governor is True
+        assert governor.is_reserve_bank_president is False
 
-    def test_create_president(self) -> None:
+    def test_create_president(self, president: FOMCMember) -> None:
         """Test creating a Reserve Bank President."""
-        member = FOMCMember(
-            name="Test President",
-            short_name="testp",
-            role=Role.PRESIDENT,
-            bank="Federal Reserve Bank of Test",
-            stance=Stance.HAWK,
-            priorities=["inflation"],
-            communication_style=CommunicationStyle.DIRECT,
-            voting_years=[2024, 2027],
-        )
-        assert member.is_governor is False
-        assert member.is_reserve_bank_president is True
+        assert president.is_governor is False
+        assert president.is_reserve_bank_president is True
 
-    def test_voting_eligibility(self) -> None:
+    def test_voting_eligibility(self, president: FOMCMember) -> None:
         """Test voting eligibility for different years."""
-        member = FOMCMember(
-            name="Test President",
-            short_name="testp",
-            role=Role.PRESIDENT,
-            bank="Federal Reserve Bank of Test",
-            stance=Stance.NEUTRAL,
-            priorities=["stability"],
-            communication_style=CommunicationStyle.MEASURED,
-            voting_years=[2024, 2027],
-        )
-        assert member.is_voting_in_year(2024) is True
-        assert member.is_voting_in_year(2025) is False
-        assert member.is_voting_in_year(2027) is True
+        assert president.is_voting_in_year(2024) is True
+        assert president.is_voting_in_year(2025) is False
+        assert president.is_voting_in_year(2027) is True
 
-    def test_governor_always_votes(self) -> None:
+    def test_governor_always_votes(self, governor: FOMCMember) -> None:
         """Test that Governors always vote."""
-        member = FOMCMember(
-            name="Test Governor",
-            short_name="testg",
-            role=Role.GOVERNOR,
-            bank="Board of Governors",
-            stance=Stance.DOVE,
-            priorities=["employment"],
-            communication_style=CommunicationStyle.ACADEMIC,
-        )
-        assert member.is_voting_in_year(2024) is True
-        assert member.is_voting_in_year(2025) is True
-        assert member.is_voting_in_year(2030) is True
+        assert governor.is_voting_in_year(2024) is True
+        assert governor.is_voting_in_year(2025) is True
+        assert governor.is_voting_in_year(2030) is True
+
+    def test_copy_with_new_voting_years(self, president: FOMCMember) -> None:
+        """Test that copying with new voting years updates eligibility."""
+        copied = president.model_copy(update={"voting_years": (2025,)})
+        assert copied.is_voting_in_year(2024) is False
+        assert copied.is_voting_in_year(2025) is True
+        assert president.is_voting_in_year(2024) is True
+
+    def test_enum_str_is_value(self) -> None:
+        """Test that member enums render as their plain values."""
+        assert str(Stance.HAWK) == "hawk"
+        assert str(Role.VICE_CHAIR) == "Vice Chair"
+        assert f"{CommunicationStyle.DATA_DRIVEN}" == "data-driven"
+        assert type(str(Role.CHAIR)) is str
 
 
 class TestMeeting:
@@ -98,47 +104,63 @@ class TestMeeting:
         assert "30" in meeting.display_date
         assert "31" in meeting.display_date
 
+    def test_copy_with_new_date(self) -> None:
+        """Test that copying with a new date doesn't keep stale date strings."""
+        meeting = Meeting(meeting_date=date(2024, 1, 15))
+        assert meeting.display_date == "January 15, 2024"
+        copied = meeting.model_copy(update={"meeting_date": date(2025, 3, 19)})
+        assert copied.month_str == "2025-03"
+        assert copied.display_date == "March 19, 2025"
+
+
+# Previous range shared by the decision tests; each case sets the new range
+DECISION_DEFAULTS = {"previous_rate_lower": 5.00, "previous_rate_upper": 5.25}
+
 
 class TestDecision:
     """Tests for Decision model."""
 
-    def test_rate_raise(self) -> None:
-        """Test rate raise decision."""
+    @pytest.mark.parametrize(
+        ("rate_decision", "change_bps", "lower", "upper", "expected_range"),
+        [
+            (RateDecision.RAISE, 25, 5.25, 5.50, "5.25-5.50%"),
+            (RateDecision.HOLD, 0, 5.00, 5.25, "5.00-5.25%"),
+            (RateDecision.CUT, -25, 4.75, 5.00, "4.75-5.00%"),
+        ],
+    )
+    def test_rate_decision(
+        self,
+        rate_decision: RateDecision,
+        change_bps: int,
+        lower: float,
+        upper: float,
+        expected_range: str,
+    ) -> None:
+        """Test raise, hold, and cut decisions."""
         decision = Decision(
-            rate_decision=RateDecision.RAISE,
-            rate_change_bps=25,
-            new_rate_lower=5.25,
-            new_rate_upper=5.50,
-            previous_rate_lower=5.00,
-            previous_rate_upper=5.25,
+            rate_decision=rate_decision,
+            rate_change_bps=change_bps,
+            new_rate_lower=lower,
+            new_rate_upper=upper,
+            **DECISION_DEFAULTS,
         )
-        assert decision.rate_range_str == "5.25-5.50%"
-        assert decision.rate_change_bps == 25
+        assert decision.rate_change_bps == change_bps
+        assert decision.rate_range_str == expected_range
+        assert decision.previous_rate_range_str == "5.00-5.25%"
 
-    def test_rate_hold(self) -> None:
-        """Test rate hold decision."""
+    def test_copy_with_new_rates(self) -> None:
+        """Test that copying with new rates doesn't keep a stale range string."""
         decision = Decision(
             rate_decision=RateDecision.HOLD,
             rate_change_bps=0,
             new_rate_lower=5.00,
             new_rate_upper=5.25,
-            previous_rate_lower=5.00,
-            previous_rate_upper=5.25,
+            **DECISION_DEFAULTS,
         )
-        assert decision.rate_change_bps == 0
-        assert decision.previous_rate_range_str == decision.rate_range_str
-
-    def test_rate_cut(self) -> None:
-        """Test rate cut decision."""
-        decision = Decision(
-            rate_decision=RateDecision.CUT,
-            rate_change_bps=-25,
-            new_rate_lower=4.75,
-            new_rate_upper=5.00,
-            previous_rate_lower=5.00,
-            previous_rate_upper=5.25,
-        )
-        assert decision.rate_change_bps == -25
+        assert decision.rate_range_str == "5.00-5.25%"
+        copied = decision.model_copy(update={"new_rate_lower": 4.75, "new_rate_upper": 5.00})
+        assert copied.rate_range_str == "4.75-5.00%"
+        assert copied.previous_rate_range_str == "5.00-5.25%"
 
 
 class TestVote:
@@ -169,3 +191,37 @@ class TestVote:
         assert vote.vote_for_decision is False
         assert vote.is_dissent is True
         assert vote.dissent_reason == "Inflation concerns"
+
+
+class TestMeetingResult:
+    """Tests for MeetingResult model."""
+
+    def test_vote_tally_follows_copies(self) -> None:
+        """Test that the vote tally can't be bypassed by assignment and follows copies."""
+        votes = [
+            Vote(
+                member_name=f"Member {i}",
+                vote_for_decision=i > 0,
+                preferred_rate=5.00,
+                is_dissent=i == 0,
+            )
+            for i in range(3)
+        ]
+        result = MeetingResult(
+            meeting=Meeting(meeting_date=date(2024, 1, 15)),
+            decision=Decision(
+                rate_decision=RateDecision.HOLD,
+                rate_change_bps=0,
+                new_rate_lower=5.00,
+                new_rate_upper=5.25,
+                **DECISION_DEFAULTS,
+            ),
+            votes=votes,
+        )
+        assert result.vote_summary == "2-1 (Member 0 dissented)"
+        with pytest.raises(ValidationError):
+            result.votes = votes[1:]
+        assert result.vote_summary == "2-1 (Member 0 dissented)"
+        copied = result.model_copy(update={"votes": votes[1:]})
+        assert copied.vote_summary == "Unanimous (2-0)"
+        assert not copied.has_dissents
@@ -0,0 +1,121 @@
+"""Tests for the PDF minutes generator."""
+
+import importlib
+import multiprocessing
+import sys
+from datetime import date
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+from fed_board.config import Settings
+from fed_board.models.meeting import Decision, Meeting, MeetingResult, RateDecision
+
+
+class _FakeCSS:
+    """Stand-in for weasyprint.CSS."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        pass
+
+
+class _FakeHTML:
+    """Stand-in for weasyprint.HTML that "renders" the HTML source as the PDF body."""
+
+    def __init__(self, string: str) -> None:
+        self.string = string
+
+    def write_pdf(self, **_options: Any) -> bytes:
+        return b"%PDF-" + self.string.encode()
+
+
+def _make_result(meeting_date: date, economic_outlook: str = "") -> MeetingResult:
+    """Create a minimal meeting result to render."""
+    return MeetingResult(
+        meeting=Meeting(meeting_date=meeting_date),
+        decision=Decision(
+            rate_decision=RateDecision.HOLD,
+            rate_change_bps=0,
+            new_rate_lower=4.25,
+            new_rate_upper=4.50,
+            previous_rate_lower=4.25,
+            previous_rate_upper=4.50,
+        ),
+        economic_outlook=economic_outlook,
+    )
+
+
+@pytest.fixture
+def pdf(monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    """Import the PDF module against a stubbed WeasyPrint, which needs native libraries."""
+    weasyprint = ModuleType("weasyprint")
+    weasyprint.CSS = _FakeCSS  # type: ignore[attr-defined]
+    weasyprint.HTML = _FakeHTML  # type: ignore[attr-defined]
+    fonts = ModuleType("weasyprint.text.fonts")
+    fonts.FontConfiguration = object  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "weasyprint", weasyprint)
+    monkeypatch.setitem(sys.modules, "weasyprint.text", ModuleType("weasyprint.text"))
+    monkeypatch.setitem(sys.modules, "weasyprint.text.fonts", fonts)
+    monkeypatch.delitem(sys.modules, "fed_board.outputs.pdf", raising=False)
+    return importlib.import_module("fed_board.outputs.pdf")
+
+
+@pytest.fixture
+def settings(tmp_path: Path) -> Settings:
+    """Create settings writing into a temporary data directory."""
+    return Settings(anthropic_api_key="x", fred_api_key="y", data_dir=tmp_path)
+
+
+class TestPDFGenerator:
+    """Tests for PDFGenerator."""
+
+    def test_economic_outlook_is_escaped(self, pdf: ModuleType, settings: Settings) -> None:
+        """Test that outlook text is escaped even when it already looks like HTML."""
+        result = _make_result(
+            date(2025, 1, 29), "<p>Growth <script>x</script></p>\n\nRisks are **balanced**."
+        )
+        html = pdf.PDFGenerator(settings).generate_html(result)
+        assert "<script>" not in html
+        assert "<p>&lt;p&gt;Growth &lt;script&gt;x&lt;/script&gt;&lt;/p&gt;</p>" in html
+        assert "<p>Risks are <strong>balanced</strong>.</p>" in html
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_generate_many(
+        self, pdf: ModuleType, settings: Settings, tmp_path: Path, max_workers: int
+    ) -> None:
+        """Test that batch rendering returns one PDF per result, in input order."""
+        if max_workers > 1 and multiprocessing.get_start_method() != "fork":
+            pytest.skip("pool workers only inherit the WeasyPrint stub when forked")
+        results = [_make_result(date(2025, month, 15)) for month in (6, 1, 3)]
+        paths = pdf.PDFGenerator(settings).generate_many(
+            results, tmp_path / "out", max_workers=max_workers
+        )
+        assert paths == [tmp_path / "out" / f"2025-{m}.pdf" for m in ("06", "01", "03")]
+        for path, result in zip(paths, results, strict=True):
+            body = path.read_bytes()
+            assert body.startswith(b"%PDF-")
+            assert result.meeting.display_date.encode() in body
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_generate_all_formats_many(
+        self, pdf: ModuleType, settings: Settings, tmp_path: Path, max_workers: int
+    ) -> None:
+        """Test that batch rendering writes Markdown and PDF per result, in input order."""
+        if max_workers > 1 and multiprocessing.get_start_method() != "fork":
+            pytest.skip("pool workers only inherit the WeasyPrint stub when forked")
+        results = [_make_result(date(2025, month, 15)) for month in (6, 1, 3)]
+        outputs = pdf.PDFGenerator(settings).generate_all_formats_many(
+            results, tmp_path / "out", max_workers=max_workers
+        )
+        assert outputs == [
+            {
+                "markdown": tmp_path / "out" / f"2025-{m}.md",
+                "pdf": tmp_path / "out" / f"2025-{m}.pdf",
+            }
+            for m in ("06", "01", "03")
+        ]
+        for output, result in zip(outputs, results, strict=True):
+            assert result.meeting.display_date in output["markdown"].read_text()
+            assert output["pdf"].read_bytes().startswith(b"%PDF-")
@@ -4,11 +4,18 @@ import pytest
 
 from fed_board.agents.personas import (
     FOMC_MEMBERS,
+    get_attendance_groups,
     get_member_by_name,
     get_members_by_stance,
     get_voting_members,
 )
-from fed_board.models.member import Stance
+from fed_board.models.member import FOMCMember, Stance
+
+
+@pytest.fixture(scope="module")
+def by_stance() -> dict[Stance, list[FOMCMember]]:
+    """Group the roster by stance once for the module."""
+    return {stance: get_members_by_stance(stance) for stance in Stance}
 
 
 class TestPersonas:
@@ -52,16 +59,37 @@ class TestPersonas:
         voters_2024 = get_voting_members(2024)
         assert len(voters_2024) >= 7  # At least all Governors
 
-    def test_get_members_by_stance(self) -> None:
+    def test_voting_members_are_a_fresh_list(self) -> None:
+        """Test that mutating a returned roster doesn't affect later calls."""
+        voters = get_voting_members(2024)
+        voters.clear()
+        assert get_voting_members(2024)
+
+    def test_get_attendance_groups(self) -> None:
+        """Test that attendance groups cover every member exactly once."""
+        groups = get_attendance_groups(2025)
+        assert groups.chair is not None
+        assert groups.ny_president is not None
+        listed = [
+            groups.chair,
+            groups.vice_chair,
+            groups.vice_chair_supervision,
+            *groups.governors,
+            groups.ny_president,
+            *groups.voting_presidents,
+            *groups.non_voting_presidents,
+        ]
+        assert sorted(m.short_name for m in listed if m) == sorted(
+            m.short_name for m in FOMC_MEMBERS
+        )
+        assert all(p.is_voting_in_year(2025) for p in groups.voting_presidents)
+
+    def test_get_members_by_stance(self, by_stance: dict[Stance, list[FOMCMember]]) -> None:
         """Test getting members by stance."""
-        hawks = get_members_by_stance(Stance.HAWK)
-        assert len(hawks) >= 1
-
-        doves = get_members_by_stance(Stance.DOVE)
-        assert len(doves) >= 1
-
-        neutrals = get_members_by_stance(Stance.NEUTRAL)
-        assert len(neutrals) >= 1
+        assert len(by_stance[Stance.HAWK]) >= 1
+        assert len(by_stance[Stance.DOVE]) >= 1
+        assert len(by_stance[Stance.NEUTRAL]) >= 1
+        assert sum(len(members) for members in by_stance.values()) == len(FOMC_MEMBERS)
 
     def test_all_members_have_required_fields(self) -> None:
         """Test that all members have required fields."""